@@ -2,16 +2,25 @@
 """
 Build script for CPU Temperature Widget.
 
-Creates a portable single-file executable using PyInstaller.
+Creates a portable one-folder executable using PyInstaller.
 """
 
 import os
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Directories never searched for __pycache__ during clean_build
+SKIP_DIRS = {'.git', '.venv', 'venv', 'node_modules', 'dist', 'build'}
+
+# PyInstaller output log and the buffer size used to stream it
+BUILD_LOG = 'build.log'
+LOG_BUFFER_SIZE = 1 << 20
+
+
 def create_icon():
     """Create the application icon from embedded data."""
     from resources.icon_data import save_icon
@@ -65,6 +74,37 @@ VSVersionInfo(
     print("Created version_info.txt")
 
 
+def compile_config():
+    """
+    Compile config.py to a C extension with mypyc (optional).
+    
+    Returns True if the extension was built. Falls back to the pure
+    Python module if mypyc is not installed or compilation fails.
+    """
+    print("Compiling config.py with mypyc...")
+    result = subprocess.run(
+        [sys.executable, '-m', 'mypyc', '--ignore-missing-imports', 'config.py'],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0 or not list(Path('.').glob('config*.pyd')):
+        # mypyc reports type errors on stdout, build failures on stderr
+        output = (result.stdout + result.stderr).strip()
+        if output:
+            print(output)
+        print("  mypyc unavailable or failed, bundling pure Python config")
+        remove_compiled_config()
+        return False
+    print("  Compiled config extension")
+    return True
+
+
+def remove_compiled_config():
+    """Remove mypyc output so it cannot shadow config.py during development."""
+    for pattern in ('config*.pyd', '*__mypyc*.pyd', 'config.c'):
+        for path in Path('.').glob(pattern):
+            path.unlink()
+
+
 def clean_build():
     """Clean previous build artifacts."""
     dirs_to_clean = ['build', 'dist', '__pycache__']
@@ -75,13 +115,17 @@ def clean_build():
             print(f"Cleaning {dir_name}/...")
             shutil.rmtree(dir_name)
     
-    # Clean pycache in subdirectories
+    # Clean pycache in subdirectories (removed in parallel), without
+    # descending into VCS, virtualenv or build output directories
+    pycache_dirs = []
     for root, dirs, files in os.walk('.'):
-        for dir_name in dirs:
-            if dir_name == '__pycache__':
-                path = os.path.join(root, dir_name)
-                print(f"Cleaning {path}/...")
-                shutil.rmtree(path)
+        if '__pycache__' in dirs:
+            pycache_dirs.append(os.path.join(root, '__pycache__'))
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS and d != '__pycache__']
+    for path in pycache_dirs:
+        print(f"Cleaning {path}/...")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(shutil.rmtree, pycache_dirs))
 
 
 def build():
@@ -105,6 +149,9 @@ def build():
     # Create version info
     create_version_info()
     
+    # AOT-compile the config module (picked up by build.spec if present)
+    compile_config()
+    
     # Run PyInstaller
     print("\nRunning PyInstaller...")
     cmd = [
@@ -114,25 +161,49 @@ def build():
         'build.spec'
     ]
     
-    result = subprocess.run(cmd, capture_output=False)
+    # Compress binaries with UPX if available (UPX_DIR or tools/upx)
+    upx_dir = Path(os.environ.get('UPX_DIR', 'tools/upx'))
+    if (upx_dir / 'upx.exe').exists():
+        print(f"Using UPX from {upx_dir}")
+        cmd[-1:-1] = ['--upx-dir', str(upx_dir)]
+    else:
+        print("UPX not found, skipping compression")
+    
+    # Stream PyInstaller output straight into a log file with a large buffer
+    print(f"Writing build output to {BUILD_LOG}")
+    with open(BUILD_LOG, 'wb') as log:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=LOG_BUFFER_SIZE
+        )
+        shutil.copyfileobj(proc.stdout, log, length=LOG_BUFFER_SIZE)
+        proc.stdout.close()
+        returncode = proc.wait()
+    
+    remove_compiled_config()
     
-    if result.returncode == 0:
-        exe_path = Path('dist/CPUTempWidget.exe')
+    if returncode == 0:
+        dist_dir = Path('dist/CPUTempWidget')
+        exe_path = dist_dir / 'CPUTempWidget.exe'
         if exe_path.exists():
-            size_mb = exe_path.stat().st_size / (1024 * 1024)
+            size_mb = sum(
+                f.stat().st_size for f in dist_dir.rglob('*') if f.is_file()
+            ) / (1024 * 1024)
             print("\n" + "="*60)
             print("BUILD SUCCESSFUL!")
             print("="*60)
             print(f"\nExecutable: {exe_path.absolute()}")
-            print(f"Size: {size_mb:.1f} MB")
-            print("\nTo run, execute CPUTempWidget.exe")
+            print(f"Size: {size_mb:.1f} MB (whole folder)")
+            print("\nTo run, execute CPUTempWidget.exe (keep it with the rest of the folder)")
             print("For best results, run as Administrator.")
         else:
             print("\nBuild completed but executable not found!")
             return 1
     else:
-        print("\nBuild failed!")
-        return result.returncode
+        print(f"\nBuild failed! See {BUILD_LOG} for details.")
+        return returncode
     
     return 0
 
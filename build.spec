@@ -9,18 +9,24 @@ Or simply run:
     python build.py
 """
 
+import glob
 import os
 import sys
 
 block_cipher = None
 
+# mypyc-compiled config module and its runtime, produced by build.py
+compiled_binaries = [
+    (path, '.') for path in glob.glob('config*.pyd') + glob.glob('*__mypyc*.pyd')
+]
+
 # Get the directory containing this spec file
 spec_dir = os.path.dirname(os.path.abspath(SPECPATH))
 
 a = Analysis(
     ['main.py'],
     pathex=[spec_dir],
-    binaries=[],
+    binaries=compiled_binaries,
     datas=[
         ('resources/styles.qss', 'resources'),
         ('resources/icon_data.py', 'resources'),
@@ -30,13 +36,13 @@ a = Analysis(
         ('THIRD-PARTY-LICENSES.txt', '.'),
     ],
     hiddenimports=[
+        'config',
         'PyQt6.QtCore',
         'PyQt6.QtGui',
         'PyQt6.QtWidgets',
         'clr',
         'clr_loader',
         'pythonnet',
-        'wmi',
         'win32com',
         'win32com.client',
     ],
@@ -49,28 +55,51 @@ a = Analysis(
         'numpy',
         'pandas',
         'scipy',
+        # Unused stdlib modules
+        'unittest',
+        'pydoc',
+        'pydoc_data',
+        'xmlrpc',
+        'test',
+        # Unused Qt modules (only QtCore/QtGui/QtWidgets are needed)
+        'PyQt6.QtWebEngineCore',
+        'PyQt6.QtWebEngineWidgets',
+        'PyQt6.QtQml',
+        'PyQt6.QtNetwork',
+        'PyQt6.QtMultimedia',
+        'PyQt6.QtPdf',
+        'PyQt6.QtSql',
+        'PyQt6.QtTest',
+        'PyQt6.QtOpenGL',
+        'PyQt6.QtDBus',
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=2,  # Strip asserts and docstrings from bundled bytecode
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# One-folder build: avoids re-extracting the bundle to %TEMP% on every launch
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='CPUTempWidget',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
+    # Compressing the runtime DLLs trips some antivirus heuristics
+    upx_exclude=[
+        'vcruntime140.dll',
+        'vcruntime140_1.dll',
+        'python3.dll',
+        'python312.dll',
+    ],
     runtime_tmpdir=None,
     console=False,  # No console window
     disable_windowed_traceback=False,
@@ -82,3 +111,19 @@ exe = EXE(
     version='version_info.txt' if os.path.exists('version_info.txt') else None,
     uac_admin=True,  # Request admin privileges for hardware monitoring
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[
+        'vcruntime140.dll',
+        'vcruntime140_1.dll',
+        'python3.dll',
+        'python312.dll',
+    ],
+    name='CPUTempWidget',
+)
@@ -1,20 +1,25 @@
 """
 Configuration management for CPU Temperature Widget.
-Stores settings in %APPDATA%/CPUTempWidget/config.json
+Stores settings in %APPDATA%/CPUTempWidget/config.ini via QSettings
 """
 
+import atexit
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Mapping, Optional
 import winreg
 
+from PyQt6.QtCore import QSettings, QTimer
+
 
 class Config:
     """Manages application configuration with auto-save functionality."""
     
-    # Default configuration values
-    DEFAULTS = {
+    # Default configuration values (plain dict kept for fast copying)
+    _DEFAULTS_DICT: ClassVar[dict[str, Any]] = {
         # Widget position (None means center of primary screen)
         'position_x': None,
         'position_y': None,
@@ -34,22 +39,65 @@ class Config:
         # Internal
         'first_run': True,
     }
+    DEFAULTS: ClassVar[Mapping[str, Any]] = MappingProxyType(_DEFAULTS_DICT)
+    
+    # Value types used to read settings back from the INI file
+    _TYPES: ClassVar[Mapping[str, type]] = MappingProxyType({
+        'position_x': int,
+        'position_y': int,
+        'position_locked': bool,
+        'warning_threshold': int,
+        'text_size': str,
+        'transparency': int,
+        'always_on_top': bool,
+        'update_interval': float,
+        'start_with_windows': bool,
+        'widget_visible': bool,
+        'first_run': bool,
+    })
     
     # Text size mappings (font size in points)
-    TEXT_SIZES = {
+    TEXT_SIZES: ClassVar[Mapping[str, int]] = MappingProxyType({
         'small': 14,
         'medium': 18,
         'large': 24,
-    }
+    })
     
     # Update interval options
-    UPDATE_INTERVALS = [0.5, 1.0, 2.0]
+    UPDATE_INTERVALS: ClassVar[list[float]] = [0.5, 1.0, 2.0]
+    
+    # Per-key normalizers applied by set(), called with (new, current) value:
+    # ranges are clamped, unknown choices are ignored (the current value stays)
+    _VALIDATORS: ClassVar[Mapping[str, Callable[[Any, Any], Any]]] = MappingProxyType({
+        'warning_threshold': lambda v, cur: max(40, min(100, int(v))),
+        'transparency': lambda v, cur: max(30, min(90, int(v))),
+        'text_size': lambda v, cur: v if v in Config.TEXT_SIZES else cur,
+        'update_interval': lambda v, cur: v if v in Config.UPDATE_INTERVALS else cur,
+    })
+    
+    # Windows startup registry entry
+    RUN_KEY_PATH: ClassVar[str] = r"Software\Microsoft\Windows\CurrentVersion\Run"
+    RUN_VALUE_NAME: ClassVar[str] = "CPUTempWidget"
     
-    def __init__(self):
+    # Delay before a burst of changes is written to disk (ms)
+    SAVE_DELAY_MS: ClassVar[int] = 500
+    
+    def __init__(self) -> None:
         """Initialize configuration manager."""
         self._config_dir = self._get_config_dir()
-        self._config_file = self._config_dir / 'config.json'
-        self._settings = dict(self.DEFAULTS)
+        self._config_file = self._config_dir / 'config.ini'
+        self._legacy_file = self._config_dir / 'config.json'
+        self._qs = QSettings(str(self._config_file), QSettings.Format.IniFormat)
+        self._settings: dict[str, Any] = self._DEFAULTS_DICT.copy()
+        self._pending_keys: set[str] = set()
+        self._run_key: Optional[winreg.HKEYType] = None
+        
+        # Coalesce rapid setter calls (drags, sliders) into a single write
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.SAVE_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        
         self._load()
     
     def _get_config_dir(self) -> Path:
@@ -65,43 +113,79 @@ class Config:
         return config_dir
     
     def _load(self):
-        """Load configuration from file."""
-        if self._config_file.exists():
-            try:
-                with open(self._config_file, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
-                    # Merge with defaults (in case new settings were added)
-                    for key, value in loaded.items():
-                        if key in self.DEFAULTS:
-                            self._settings[key] = value
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load config: {e}")
-                # Use defaults on error
+        """Load configuration from QSettings."""
+        if not self._config_file.exists() and self._legacy_file.exists():
+            self._import_legacy_json()
+            return
+        
+        # Keys missing from the file keep their defaults
+        for key, value_type in self._TYPES.items():
+            if self._qs.contains(key):
+                try:
+                    self._settings[key] = self._qs.value(key, type=value_type)
+                except (TypeError, ValueError) as e:
+                    print(f"Warning: Could not load config value {key}: {e}")
     
-    def save(self):
-        """Save configuration to file."""
+    def _import_legacy_json(self):
+        """One-time migration of settings from the old config.json file."""
         try:
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2)
-        except IOError as e:
-            print(f"Warning: Could not save config: {e}")
+            loaded = json.loads(self._legacy_file.read_bytes())
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not load config: {e}")
+            return  # Use defaults on error
+        
+        for key, value in loaded.items():
+            if key in self.DEFAULTS:
+                self._settings[key] = value
+                self._pending_keys.add(key)
+        self.save()
+    
+    def save(self):
+        """Write changed settings to QSettings and sync to disk immediately."""
+        self._flush_timer.stop()
+        
+        if not self._pending_keys:
+            return  # Nothing changed since the last write
+        
+        for key in self._pending_keys:
+            value = self._settings[key]
+            if value is None:
+                self._qs.remove(key)
+            else:
+                self._qs.setValue(key, value)
+        self._pending_keys.clear()
+        
+        self._qs.sync()
+        if self._qs.status() != QSettings.Status.NoError:
+            print(f"Warning: Could not save config: {self._qs.status().name}")
+    
+    def flush(self):
+        """Write pending changes to file, if any (including auto_save=False ones)."""
+        if self._pending_keys:
+            self.save()
+    
+    def _mark_dirty(self):
+        """Schedule a deferred save, restarting the delay on each change."""
+        self._flush_timer.start()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
         return self._settings.get(key, default)
     
     def set(self, key: str, value: Any, auto_save: bool = True):
-        """Set a configuration value."""
-        if key in self.DEFAULTS:
+        """Set a configuration value (no-op if it is unchanged)."""
+        validator = self._VALIDATORS.get(key)
+        if validator is not None:
+            value = validator(value, self._settings[key])
+        if key in self.DEFAULTS and self._settings[key] != value:
             self._settings[key] = value
+            self._pending_keys.add(key)
             if auto_save:
-                self.save()
+                self._mark_dirty()
     
     def reset_position(self):
         """Reset widget position to default (center of screen)."""
-        self._settings['position_x'] = None
-        self._settings['position_y'] = None
-        self.save()
+        self.position = (None, None)
     
     # Convenience properties
     @property
@@ -110,11 +194,10 @@ class Config:
         return (self._settings['position_x'], self._settings['position_y'])
     
     @position.setter
-    def position(self, pos: tuple[int, int]):
+    def position(self, pos: tuple[Optional[int], Optional[int]]):
         """Set widget position."""
-        self._settings['position_x'] = pos[0]
-        self._settings['position_y'] = pos[1]
-        self.save()
+        self.set('position_x', pos[0])
+        self.set('position_y', pos[1])
     
     @property
     def position_locked(self) -> bool:
@@ -122,8 +205,7 @@ class Config:
     
     @position_locked.setter
     def position_locked(self, value: bool):
-        self._settings['position_locked'] = value
-        self.save()
+        self.set('position_locked', value)
     
     @property
     def warning_threshold(self) -> int:
@@ -131,8 +213,7 @@ class Config:
     
     @warning_threshold.setter
     def warning_threshold(self, value: int):
-        self._settings['warning_threshold'] = max(40, min(100, value))
-        self.save()
+        self.set('warning_threshold', value)
     
     @property
     def text_size(self) -> str:
@@ -140,9 +221,7 @@ class Config:
     
     @text_size.setter
     def text_size(self, value: str):
-        if value in self.TEXT_SIZES:
-            self._settings['text_size'] = value
-            self.save()
+        self.set('text_size', value)
     
     @property
     def font_size(self) -> int:
@@ -155,8 +234,7 @@ class Config:
     
     @transparency.setter
     def transparency(self, value: int):
-        self._settings['transparency'] = max(30, min(90, value))
-        self.save()
+        self.set('transparency', value)
     
     @property
     def always_on_top(self) -> bool:
@@ -164,8 +242,7 @@ class Config:
     
     @always_on_top.setter
     def always_on_top(self, value: bool):
-        self._settings['always_on_top'] = value
-        self.save()
+        self.set('always_on_top', value)
     
     @property
     def update_interval(self) -> float:
@@ -173,9 +250,7 @@ class Config:
     
     @update_interval.setter
     def update_interval(self, value: float):
-        if value in self.UPDATE_INTERVALS:
-            self._settings['update_interval'] = value
-            self.save()
+        self.set('update_interval', value)
     
     @property
     def start_with_windows(self) -> bool:
@@ -183,9 +258,10 @@ class Config:
     
     @start_with_windows.setter
     def start_with_windows(self, value: bool):
-        self._settings['start_with_windows'] = value
-        self._update_startup_registry(value)
-        self.save()
+        # Compare against the registry, which may have drifted from the file
+        if value != self.check_startup_registry():
+            self._update_startup_registry(value)
+        self.set('start_with_windows', value)
     
     @property
     def widget_visible(self) -> bool:
@@ -193,8 +269,7 @@ class Config:
     
     @widget_visible.setter
     def widget_visible(self, value: bool):
-        self._settings['widget_visible'] = value
-        self.save()
+        self.set('widget_visible', value)
     
     @property
     def first_run(self) -> bool:
@@ -202,21 +277,32 @@ class Config:
     
     @first_run.setter
     def first_run(self, value: bool):
-        self._settings['first_run'] = value
-        self.save()
+        self.set('first_run', value)
     
-    def _update_startup_registry(self, enable: bool):
-        """Add or remove the app from Windows startup."""
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-        app_name = "CPUTempWidget"
-        
-        try:
-            key = winreg.OpenKey(
+    def _get_run_key(self) -> winreg.HKEYType:
+        """Open the startup Run key once and keep it for the process lifetime."""
+        if self._run_key is None:
+            self._run_key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
-                key_path,
+                self.RUN_KEY_PATH,
                 0,
                 winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE
             )
+            atexit.register(self._close_run_key)
+        return self._run_key
+    
+    def _close_run_key(self):
+        """Release the cached Run key handle."""
+        if self._run_key is not None:
+            winreg.CloseKey(self._run_key)
+            self._run_key = None
+    
+    def _update_startup_registry(self, enable: bool):
+        """Add or remove the app from Windows startup."""
+        app_name = self.RUN_VALUE_NAME
+        
+        try:
+            key = self._get_run_key()
             
             if enable:
                 import sys
@@ -246,42 +332,23 @@ class Config:
                     winreg.DeleteValue(key, app_name)
                 except FileNotFoundError:
                     pass  # Already removed
-            
-            winreg.CloseKey(key)
         except WindowsError:
             pass  # Silently fail if registry access denied
     
     def check_startup_registry(self) -> bool:
-        """Check if the app is set to start with Windows."""
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-        app_name = "CPUTempWidget"
-        
+        """
+        Check if the app is set to start with Windows.
+        Always read (one QueryValueEx on the held-open Run key), since the
+        entry can be changed outside the app.
+        """
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                key_path,
-                0,
-                winreg.KEY_QUERY_VALUE
-            )
-            
-            try:
-                winreg.QueryValueEx(key, app_name)
-                winreg.CloseKey(key)
-                return True
-            except FileNotFoundError:
-                winreg.CloseKey(key)
-                return False
+            winreg.QueryValueEx(self._get_run_key(), self.RUN_VALUE_NAME)
+            return True
         except WindowsError:
-            return False
-
-
-# Global config instance
-_config: Optional[Config] = None
+            return False  # Value missing or registry access denied
 
 
+@functools.cache
 def get_config() -> Config:
     """Get the global configuration instance."""
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    return Config()
@@ -20,14 +20,9 @@ else:
 sys.path.insert(0, APP_DIR)
 
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtWidgets import QApplication
 
 from config import get_config
-from widget import TemperatureWidget
-from tray import SystemTray
-from settings_dialog import SettingsDialog
-from temp_monitor import TemperatureMonitor, WarningStateTracker, is_admin
 
 
 class CPUTempWidgetApp:
@@ -39,34 +34,25 @@ class CPUTempWidgetApp:
     """
     
     def __init__(self):
+        # The widget and tray are needed for the first paint; the monitor
+        # (and its pythonnet/win32com probing) waits for the event loop
+        from widget import TemperatureWidget
+        from tray import SystemTray
+        
         self._config = get_config()
         self._settings_dialog = None
         
         # Create components
         self._widget = TemperatureWidget()
         self._tray = SystemTray()
-        self._warning_tracker = WarningStateTracker(
-            threshold=self._config.warning_threshold
-        )
-        self._monitor = TemperatureMonitor(
-            update_interval=self._config.update_interval
-        )
+        self._warning_tracker = None  # Created with the monitor
+        self._monitor = None
         
         # Connect signals
         self._setup_connections()
-        
-        # Show admin warning on first run if not admin
-        if self._config.first_run:
-            self._config.first_run = False
-            if not is_admin():
-                QTimer.singleShot(2000, self._show_admin_notification)
     
     def _setup_connections(self):
         """Set up signal connections between components."""
-        # Temperature updates
-        self._monitor.temperature_updated.connect(self._on_temperature_updated)
-        self._monitor.error_occurred.connect(self._on_monitor_error)
-        
         # Tray actions
         self._tray.connect_show_action(self._toggle_widget_visibility)
         self._tray.connect_settings_action(self._show_settings)
@@ -102,12 +88,17 @@ class CPUTempWidgetApp:
         else:
             self._widget.hide()
         
+        # Only the tray needs readings while hidden, so poll less often
+        if self._monitor is not None:
+            self._monitor.set_idle(not visible)
         self._config.widget_visible = visible
         self._tray.sync_visibility_state(visible)
     
     def _show_settings(self):
         """Show the settings dialog."""
         if self._settings_dialog is None:
+            # Only imported the first time the user opens settings
+            from settings_dialog import SettingsDialog
             self._settings_dialog = SettingsDialog()
             self._settings_dialog.settings_changed.connect(self._apply_settings)
             self._settings_dialog.position_reset.connect(self._reset_position)
@@ -118,11 +109,10 @@ class CPUTempWidgetApp:
     
     def _apply_settings(self):
         """Apply changed settings to all components."""
-        # Update monitor interval
-        self._monitor.set_interval(self._config.update_interval)
-        
-        # Update warning tracker threshold
-        self._warning_tracker.update_threshold(self._config.warning_threshold)
+        # Update monitor interval and warning tracker threshold
+        if self._monitor is not None:
+            self._monitor.set_interval(self._config.update_interval)
+            self._warning_tracker.update_threshold(self._config.warning_threshold)
         
         # Update widget appearance
         self._widget.apply_settings()
@@ -152,16 +142,42 @@ class CPUTempWidgetApp:
         if self._config.widget_visible:
             self._widget.show()
         
-        # Start temperature monitoring
+        # Start temperature monitoring once the event loop has painted
+        QTimer.singleShot(0, self._start_monitor)
+    
+    def _start_monitor(self):
+        """Import, create and start the temperature monitor."""
+        from temp_monitor import TemperatureMonitor, WarningStateTracker, is_admin
+        
+        self._warning_tracker = WarningStateTracker(
+            threshold=self._config.warning_threshold
+        )
+        self._monitor = TemperatureMonitor(
+            update_interval=self._config.update_interval
+        )
+        
+        # Temperature updates
+        self._monitor.temperature_updated.connect(self._on_temperature_updated)
+        self._monitor.error_occurred.connect(self._on_monitor_error)
+        
+        self._monitor.set_idle(not self._config.widget_visible)
         self._monitor.start()
+        
+        # Show admin warning on first run if not admin
+        if self._config.first_run:
+            self._config.first_run = False
+            if not is_admin():
+                QTimer.singleShot(2000, self._show_admin_notification)
     
     def stop(self):
         """Stop the application and clean up."""
         # Stop monitoring
-        self._monitor.stop()
+        if self._monitor is not None:
+            self._monitor.stop()
         
-        # Save config
-        self._config.save()
+        # Write any pending config changes
+        self._widget.flush_position()
+        self._config.flush()
         
         # Hide components
         self._tray.hide()
@@ -175,6 +191,9 @@ def main():
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
     
+    # Share GL contexts so translucent windows don't recreate them
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
+    
     # Create application
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)  # Keep running in tray
@@ -184,16 +203,26 @@ def main():
     app.setApplicationVersion("1.1.0")
     app.setOrganizationName("Virtual Platforms LLC")
     
-    # Set application icon globally
-    icon_path = os.path.join(APP_DIR, 'resources', 'icon.ico')
+    # Bundled resources (check MEIPASS when running as compiled executable)
+    resources_dir = os.path.join(APP_DIR, 'resources')
     if getattr(sys, 'frozen', False):
-        # Running as compiled executable - check MEIPASS
-        icon_path = os.path.join(sys._MEIPASS, 'resources', 'icon.ico')
+        resources_dir = os.path.join(sys._MEIPASS, 'resources')
     
+    # Apply the dark theme once for the whole application
+    try:
+        with open(os.path.join(resources_dir, 'styles.qss'), 'r', encoding='utf-8') as f:
+            app.setStyleSheet(f.read())
+    except OSError as e:
+        print(f"Warning: Could not load stylesheet: {e}")
+    
+    # Set application icon globally
+    icon_path = os.path.join(resources_dir, 'icon.ico')
     if os.path.exists(icon_path):
+        from PyQt6.QtGui import QIcon
         app.setWindowIcon(QIcon(icon_path))
     
     # Set default font
+    from PyQt6.QtGui import QFont
     font = QFont("Segoe UI", 10)
     app.setFont(font)
     
@@ -2,9 +2,12 @@
 Settings dialog for CPU Temperature Widget.
 """
 
+import functools
 import os
 import sys
-from PyQt6.QtCore import Qt, pyqtSignal
+from typing import Optional
+
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont, QIcon
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
@@ -15,6 +18,32 @@ from PyQt6.QtWidgets import (
 from config import get_config
 
 
+# Combo box index <-> config value lookups
+_INTERVAL_TO_IDX = {0.5: 0, 1.0: 1, 2.0: 2}
+_IDX_TO_INTERVAL = {0: 0.5, 1: 1.0, 2: 2.0}
+_SIZE_TO_IDX = {'small': 0, 'medium': 1, 'large': 2}
+_IDX_TO_SIZE = {0: 'small', 1: 'medium', 2: 'large'}
+
+# Pre-formatted transparency labels for every slider position
+_PCT_STR = {i: f"{i}%" for i in range(30, 91)}
+
+# Window icon location, resolved once per process
+if getattr(sys, 'frozen', False):
+    # Running as compiled executable
+    _BASE_PATH = sys._MEIPASS
+else:
+    _BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+_ICON_PATH = os.path.join(_BASE_PATH, 'resources', 'icon.ico')
+
+
+@functools.cache
+def _get_window_icon() -> Optional[QIcon]:
+    """Load the window icon once and share it between dialog instances."""
+    if os.path.exists(_ICON_PATH):
+        return QIcon(_ICON_PATH)
+    return None
+
+
 class SettingsDialog(QDialog):
     """
     Settings dialog with all configurable options.
@@ -39,8 +68,8 @@ class SettingsDialog(QDialog):
         
         self._setup_window()
         self._setup_ui()
-        self._load_values()
         self._setup_connections()
+        # Values are loaded from config in showEvent, before first paint
     
     def _setup_window(self):
         """Configure window properties."""
@@ -56,41 +85,13 @@ class SettingsDialog(QDialog):
     
     def _set_window_icon(self):
         """Set the window icon from resources."""
-        # Try to find the icon file
-        if getattr(sys, 'frozen', False):
-            # Running as compiled executable
-            base_path = sys._MEIPASS
-        else:
-            base_path = os.path.dirname(os.path.abspath(__file__))
-        
-        icon_path = os.path.join(base_path, 'resources', 'icon.ico')
-        
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = _get_window_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
     
     def _create_group(self, title: str) -> tuple[QGroupBox, QVBoxLayout]:
         """Create a styled group box with layout."""
         group = QGroupBox(title)
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 13px;
-                border: 1px solid #45475a;
-                border-radius: 8px;
-                margin-top: 14px;
-                padding: 8px;
-                color: #cdd6f4;
-                background-color: #252535;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 12px;
-                top: 2px;
-                padding: 0 6px;
-                background-color: #1e1e2e;
-            }
-        """)
         layout = QVBoxLayout(group)
         layout.setContentsMargins(12, 20, 12, 12)
         layout.setSpacing(10)
@@ -105,7 +106,7 @@ class SettingsDialog(QDialog):
         
         label = QLabel(label_text)
         label.setMinimumWidth(120)
-        label.setStyleSheet("color: #bac2de; font-size: 12px; background: transparent;")
+        label.setObjectName("rowLabel")
         
         row_layout.addWidget(label)
         row_layout.addWidget(widget, 1)
@@ -114,110 +115,6 @@ class SettingsDialog(QDialog):
     
     def _setup_ui(self):
         """Set up the user interface."""
-        # Main window styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e2e;
-                color: #cdd6f4;
-            }
-            QSpinBox, QComboBox {
-                background-color: #313244;
-                color: #cdd6f4;
-                border: 1px solid #45475a;
-                border-radius: 6px;
-                padding: 6px 10px;
-                min-width: 140px;
-                min-height: 20px;
-                font-size: 12px;
-            }
-            QSpinBox:focus, QComboBox:focus {
-                border-color: #89b4fa;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                background-color: #45475a;
-                border: none;
-                width: 20px;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #585b70;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 24px;
-            }
-            QComboBox::down-arrow {
-                width: 10px;
-                height: 10px;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #cdd6f4;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #313244;
-                color: #cdd6f4;
-                selection-background-color: #45475a;
-                border: 1px solid #45475a;
-            }
-            QSlider {
-                min-height: 24px;
-            }
-            QSlider::groove:horizontal {
-                height: 6px;
-                background-color: #313244;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background-color: #89b4fa;
-                width: 16px;
-                height: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }
-            QSlider::handle:horizontal:hover {
-                background-color: #b4befe;
-            }
-            QSlider::sub-page:horizontal {
-                background-color: #89b4fa;
-                border-radius: 3px;
-            }
-            QCheckBox {
-                color: #cdd6f4;
-                spacing: 10px;
-                font-size: 12px;
-                min-height: 24px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 2px solid #45475a;
-                background-color: #313244;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #89b4fa;
-                border-color: #89b4fa;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #89b4fa;
-            }
-            QPushButton {
-                background-color: #45475a;
-                color: #cdd6f4;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 12px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #585b70;
-            }
-            QPushButton:pressed {
-                background-color: #313244;
-            }
-        """)
-        
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -225,7 +122,7 @@ class SettingsDialog(QDialog):
         # Title
         title = QLabel("Settings")
         title.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
-        title.setStyleSheet("color: #cdd6f4; margin-bottom: 4px; background: transparent;")
+        title.setObjectName("dialogTitle")
         layout.addWidget(title)
         
         # ===== Temperature Group =====
@@ -265,7 +162,7 @@ class SettingsDialog(QDialog):
         
         self._transparency_label = QLabel("60%")
         self._transparency_label.setMinimumWidth(40)
-        self._transparency_label.setStyleSheet("color: #89b4fa; font-weight: bold; background: transparent;")
+        self._transparency_label.setObjectName("transparencyValue")
         self._transparency_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         
         transparency_inner.addWidget(self._transparency_slider, 1)
@@ -288,16 +185,7 @@ class SettingsDialog(QDialog):
         
         # Reset position button
         self._reset_btn = QPushButton("Reset Widget Position")
-        self._reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f38ba8;
-                color: #1e1e2e;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #f5c2e7;
-            }
-        """)
+        self._reset_btn.setObjectName("dangerButton")
         layout.addWidget(self._reset_btn)
         
         # Spacer
@@ -313,52 +201,63 @@ class SettingsDialog(QDialog):
         button_layout.addWidget(self._cancel_btn)
         
         self._apply_btn = QPushButton("Apply")
-        self._apply_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #89b4fa;
-                color: #1e1e2e;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #b4befe;
-            }
-        """)
+        self._apply_btn.setObjectName("primaryButton")
         button_layout.addWidget(self._apply_btn)
         
         layout.addLayout(button_layout)
     
     def _load_values(self):
         """Load current values from configuration."""
-        self._threshold_spin.setValue(self._config.warning_threshold)
-        
-        # Update interval
-        interval = self._config.update_interval
-        interval_idx = {0.5: 0, 1.0: 1, 2.0: 2}.get(interval, 1)
-        self._interval_combo.setCurrentIndex(interval_idx)
-        
-        # Text size
-        size = self._config.text_size
-        size_idx = {'small': 0, 'medium': 1, 'large': 2}.get(size, 1)
-        self._size_combo.setCurrentIndex(size_idx)
-        
-        # Transparency
-        self._transparency_slider.setValue(self._config.transparency)
-        self._transparency_label.setText(f"{self._config.transparency}%")
-        
-        # Checkboxes
-        self._always_on_top_check.setChecked(self._config.always_on_top)
-        self._start_with_windows_check.setChecked(self._config.start_with_windows)
+        # Batch the updates: no intermediate repaints or change signals
+        controls = (
+            self._threshold_spin, self._interval_combo, self._size_combo,
+            self._transparency_slider, self._always_on_top_check,
+            self._start_with_windows_check,
+        )
+        self.setUpdatesEnabled(False)
+        for control in controls:
+            control.blockSignals(True)
+        
+        try:
+            self._threshold_spin.setValue(self._config.warning_threshold)
+            
+            # Update interval
+            interval = self._config.update_interval
+            interval_idx = _INTERVAL_TO_IDX.get(interval, 1)
+            self._interval_combo.setCurrentIndex(interval_idx)
+            
+            # Text size
+            size = self._config.text_size
+            size_idx = _SIZE_TO_IDX.get(size, 1)
+            self._size_combo.setCurrentIndex(size_idx)
+            
+            # Transparency
+            self._transparency_slider.setValue(self._config.transparency)
+            
+            # Checkboxes
+            self._always_on_top_check.setChecked(self._config.always_on_top)
+            self._start_with_windows_check.setChecked(self._config.start_with_windows)
+        finally:
+            for control in controls:
+                control.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        
+        # The slider's valueChanged was blocked, so sync its label directly
+        self._transparency_label.setText(_PCT_STR[self._transparency_slider.value()])
     
     def _setup_connections(self):
         """Set up signal connections."""
-        self._transparency_slider.valueChanged.connect(
-            lambda v: self._transparency_label.setText(f"{v}%")
-        )
+        self._transparency_slider.valueChanged.connect(self._on_transparency_changed)
         
         self._reset_btn.clicked.connect(self._on_reset_position)
         self._cancel_btn.clicked.connect(self.reject)
         self._apply_btn.clicked.connect(self._on_apply)
     
+    @pyqtSlot(int)
+    def _on_transparency_changed(self, value: int):
+        """Update the transparency label as the slider moves."""
+        self._transparency_label.setText(_PCT_STR[value])
+    
     def _on_reset_position(self):
         """Handle reset position button click."""
         self.position_reset.emit()
@@ -369,14 +268,12 @@ class SettingsDialog(QDialog):
         self._config.warning_threshold = self._threshold_spin.value()
         
         # Update interval
-        interval_map = {0: 0.5, 1: 1.0, 2: 2.0}
-        self._config.update_interval = interval_map.get(
+        self._config.update_interval = _IDX_TO_INTERVAL.get(
             self._interval_combo.currentIndex(), 1.0
         )
         
         # Text size
-        size_map = {0: 'small', 1: 'medium', 2: 'large'}
-        self._config.text_size = size_map.get(
+        self._config.text_size = _IDX_TO_SIZE.get(
             self._size_combo.currentIndex(), 'medium'
         )
         
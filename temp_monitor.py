@@ -11,34 +11,127 @@ Methods in order of priority:
 """
 
 import ctypes
+import functools
+import importlib.util
+import math
 import os
 import sys
 import random
 import time
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Callable, Dict, Optional, List, Tuple
+
+try:
+    from pywintypes import com_error
+except ImportError:
+    com_error = OSError  # No pywin32: the WMI sources never initialize
+
+from PyQt6.QtCore import Q_ARG, QMetaObject, Qt, QThread, QTimer, pyqtSignal
 
-from PyQt6.QtCore import QThread, pyqtSignal, QMutex
 
+# CPU temperature sensor categories, numbered in order of preference
+SENSOR_PACKAGE = 0
+SENSOR_AVERAGE = 1
+SENSOR_MAX = 2
+SENSOR_CORE = 3
 
+
+@functools.cache
 def is_admin() -> bool:
-    """Check if the application is running with administrator privileges."""
+    """Check if the application is running with administrator privileges (cached)."""
     try:
         return ctypes.windll.shell32.IsUserAnAdmin() != 0
     except Exception:
         return False
 
 
+@functools.lru_cache(maxsize=256)
+def classify_cpu_sensor(name: Optional[str]) -> Optional[int]:
+    """Map a temperature sensor name to a SENSOR_* category, or None to skip it."""
+    name = name.lower() if name else ""
+    if "package" in name:
+        return SENSOR_PACKAGE
+    if "max" in name:
+        return SENSOR_MAX
+    if "average" in name:
+        return SENSOR_AVERAGE
+    if "core" in name:
+        return SENSOR_CORE
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def classify_wmi_sensor(name: Optional[str], parent: Optional[str]) -> Optional[int]:
+    """Classify a hardware monitor WMI sensor, or None if it isn't a CPU sensor."""
+    name_lower = name.lower() if name else ""
+    parent_lower = parent.lower() if parent else ""
+    
+    # Check if it's a CPU sensor
+    is_cpu = ("cpu" in parent_lower or "intel" in parent_lower or
+              "amd" in parent_lower or "processor" in parent_lower)
+    if not (is_cpu or "cpu" in name_lower or "core" in name_lower):
+        return None
+    
+    return classify_cpu_sensor(name)
+
+
+@functools.lru_cache(maxsize=256)
+def classify_ohm_sensor(name: Optional[str], parent: Optional[str]) -> Optional[int]:
+    """Classify an OpenHardwareMonitor WMI sensor (package or core)."""
+    name = name.lower() if name else ""
+    if "cpu" not in name and "core" not in name:
+        return None
+    if "package" in name:
+        return SENSOR_PACKAGE
+    return SENSOR_CORE
+
+
 def get_app_path() -> Path:
     """Get the application path, handling both frozen exe and script mode."""
     if getattr(sys, 'frozen', False):
-        # Running as compiled exe
-        return Path(sys.executable).parent
+        # Running as compiled exe - bundled files live under _MEIPASS
+        # (the _internal folder of a one-folder build)
+        return Path(getattr(sys, '_MEIPASS', Path(sys.executable).parent))
     else:
         # Running as script
         return Path(__file__).parent
 
 
+LHM_DLL_NAME = "LibreHardwareMonitorLib.dll"
+
+# Whether pythonnet is installed, checked without importing it (importing
+# clr starts the .NET runtime)
+_HAVE_CLR = importlib.util.find_spec("clr") is not None
+
+# Location of the LHM DLL, resolved once per process
+_RESOLVED_DLL_PATH: Optional[Path] = None
+
+
+def find_lhm_dll() -> Optional[Path]:
+    """Locate LibreHardwareMonitorLib.dll in libs/ or the app directory (cached)."""
+    global _RESOLVED_DLL_PATH
+    if _RESOLVED_DLL_PATH is not None:
+        return _RESOLVED_DLL_PATH
+    
+    app_path = get_app_path()
+    libs_path = app_path / "libs"
+    
+    # One directory listing instead of a stat per candidate file
+    try:
+        with os.scandir(libs_path) as entries:
+            for entry in entries:
+                if entry.name == LHM_DLL_NAME:
+                    _RESOLVED_DLL_PATH = Path(entry.path)
+                    return _RESOLVED_DLL_PATH
+    except OSError:
+        pass  # No libs directory
+    
+    # Also check if DLLs are in the same directory as the app
+    if (app_path / LHM_DLL_NAME).exists():
+        _RESOLVED_DLL_PATH = app_path / LHM_DLL_NAME
+    return _RESOLVED_DLL_PATH
+
+
 class LibreHardwareMonitorDLL:
     """
     Wrapper for LibreHardwareMonitorLib.dll using pythonnet.
@@ -49,6 +142,9 @@ class LibreHardwareMonitorDLL:
         self._computer = None
         self._initialized = False
         self._error_msg = None
+        self._cpu_sensors: List[Tuple[object, int]] = []
+        self._cpu_hardware: List[object] = []
+        self._core_temps: List[float] = []  # Reused on every read
     
     def initialize(self) -> bool:
         """Initialize the LibreHardwareMonitor library."""
@@ -56,54 +152,64 @@ class LibreHardwareMonitorDLL:
             return True
         
         try:
-            import clr
-            
-            # Add reference to the DLL
-            app_path = get_app_path()
-            libs_path = app_path / "libs"
-            
-            # Also check if DLLs are in the same directory (PyInstaller onefile)
-            dll_locations = [
-                libs_path / "LibreHardwareMonitorLib.dll",
-                app_path / "LibreHardwareMonitorLib.dll",
-            ]
-            
-            dll_path = None
-            for loc in dll_locations:
-                if loc.exists():
-                    dll_path = loc
-                    break
-            
+            # Locate the DLL before paying for the .NET runtime import
+            dll_path = find_lhm_dll()
             if dll_path is None:
                 self._error_msg = "LibreHardwareMonitorLib.dll not found"
                 return False
             
-            # Add the DLL directory to the search path
-            clr.AddReference(str(dll_path))
-            
-            # Also add HidSharp if available
-            hidsharp_path = dll_path.parent / "HidSharp.dll"
-            if hidsharp_path.exists():
-                clr.AddReference(str(hidsharp_path))
-            
-            # Import the library
-            from LibreHardwareMonitor.Hardware import Computer, IVisitor
-            
-            # Create and configure the computer instance
-            self._computer = Computer()
-            self._computer.IsCpuEnabled = True
-            self._computer.IsGpuEnabled = False
-            self._computer.IsMemoryEnabled = False
-            self._computer.IsMotherboardEnabled = False
-            self._computer.IsControllerEnabled = False
-            self._computer.IsNetworkEnabled = False
-            self._computer.IsStorageEnabled = False
+            import clr
             
-            # Open the computer (starts hardware monitoring)
-            self._computer.Open()
+            # Pin native DLL resolution to the bundled folder while LHM loads
+            # (its native dependencies are loaded by Computer.Open())
+            try:
+                set_dll_directory = ctypes.windll.kernel32.SetDllDirectoryW
+                set_dll_directory(str(dll_path.parent))
+            except (AttributeError, OSError):
+                set_dll_directory = None
             
-            # Create an update visitor
-            self._update_visitor = _UpdateVisitor()
+            try:
+                # Add the DLL directory to the search path
+                clr.AddReference(str(dll_path))
+                
+                # Also add HidSharp if available (a safety net, it would
+                # resolve from the same folder anyway)
+                hidsharp_path = dll_path.parent / "HidSharp.dll"
+                if hidsharp_path.exists():
+                    clr.AddReference(str(hidsharp_path))
+                
+                # Import the library
+                from LibreHardwareMonitor.Hardware import Computer
+                
+                # Create and configure the computer instance
+                self._computer = Computer()
+                self._computer.IsCpuEnabled = True
+                self._computer.IsGpuEnabled = False
+                self._computer.IsMemoryEnabled = False
+                self._computer.IsMotherboardEnabled = False
+                self._computer.IsControllerEnabled = False
+                self._computer.IsNetworkEnabled = False
+                self._computer.IsStorageEnabled = False
+                
+                # Groups only present in newer LHM builds (no-ops on older DLLs)
+                for flag in ("IsPsuEnabled", "IsBatteryEnabled"):
+                    if hasattr(self._computer, flag):
+                        setattr(self._computer, flag, False)
+                
+                # Open the computer (starts hardware monitoring)
+                self._computer.Open()
+            finally:
+                # Restore the default search order for the rest of the process
+                if set_dll_directory is not None:
+                    set_dll_directory(None)
+            
+            # Resolve the CPU hardware and temperature sensors once up front;
+            # finding any is enough to know reads will work
+            self._cache_cpu_sensors()
+            if not self._cpu_sensors:
+                self._error_msg = "No CPU temperature sensors found"
+                self.close()
+                return False
             
             self._initialized = True
             return True
@@ -112,65 +218,76 @@ class LibreHardwareMonitorDLL:
             self._error_msg = f"Failed to initialize LHM DLL: {str(e)}"
             return False
     
+    def _cache_cpu_sensors(self):
+        """
+        Walk the hardware tree once and keep only the CPU temperature sensors,
+        along with the hardware that has to be updated to refresh them.
+        Every category is kept, so a reading can fall back from package to
+        average, max, then cores when a sensor misses a tick.
+        """
+        from LibreHardwareMonitor.Hardware import HardwareType, SensorType
+        
+        # Compare .NET enum values directly instead of their ToString()
+        cpu_type = HardwareType.Cpu
+        temperature_type = SensorType.Temperature
+        
+        self._cpu_sensors = []
+        self._cpu_hardware = []
+        
+        cpu_hardware = []
+        for hardware in self._computer.Hardware:
+            # Check if it's a CPU
+            if hardware.HardwareType != cpu_type:
+                continue
+            
+            cpu_hardware.append(hardware)
+            cpu_hardware.extend(hardware.SubHardware)
+        
+        for hardware in cpu_hardware:
+            # Some sensors are only created on the first update
+            hardware.Update()
+            owns_sensor = False
+            for sensor in hardware.Sensors:
+                if sensor.SensorType != temperature_type:
+                    continue
+                category = classify_cpu_sensor(sensor.Name)
+                if category is not None:
+                    self._cpu_sensors.append((sensor, category))
+                    owns_sensor = True
+            if owns_sensor:
+                self._cpu_hardware.append(hardware)
+    
     def get_cpu_temperature(self) -> Optional[float]:
         """Get the CPU temperature from the DLL."""
         if not self._initialized:
             return None
         
         try:
-            # Update all hardware
-            self._computer.Accept(self._update_visitor)
+            # Update only the hardware that owns the cached sensors
+            for hardware in self._cpu_hardware:
+                hardware.Update()
             
-            cpu_package_temp = None
-            cpu_core_temps = []
-            cpu_max_temp = None
-            cpu_avg_temp = None
+            best_temp = None
+            best_category = SENSOR_CORE
+            cpu_core_temps = self._core_temps
+            cpu_core_temps.clear()
             
-            # Iterate through hardware
-            for hardware in self._computer.Hardware:
-                hardware.Update()
+            # Only the cached CPU sensors are read, no tree walk or name parsing
+            for sensor, category in self._cpu_sensors:
+                value = sensor.Value
                 
-                # Check if it's a CPU
-                hw_type = str(hardware.HardwareType)
-                if "Cpu" not in hw_type:
+                if value is None or value <= 0 or value > 150:
                     continue
                 
-                # Update subhardware
-                for subhardware in hardware.SubHardware:
-                    subhardware.Update()
-                    for sensor in subhardware.Sensors:
-                        self._process_sensor(sensor, cpu_package_temp, cpu_core_temps, 
-                                           cpu_max_temp, cpu_avg_temp)
-                
-                # Get sensors from main hardware
-                for sensor in hardware.Sensors:
-                    sensor_type = str(sensor.SensorType)
-                    if sensor_type != "Temperature":
-                        continue
-                    
-                    name = sensor.Name.lower() if sensor.Name else ""
-                    value = sensor.Value
-                    
-                    if value is None or value <= 0 or value > 150:
-                        continue
-                    
-                    # Prioritize different sensor types
-                    if "package" in name:
-                        cpu_package_temp = float(value)
-                    elif "max" in name:
-                        cpu_max_temp = float(value)
-                    elif "average" in name:
-                        cpu_avg_temp = float(value)
-                    elif "core" in name:
-                        cpu_core_temps.append(float(value))
-            
-            # Return in order of preference
-            if cpu_package_temp is not None:
-                return cpu_package_temp
-            if cpu_avg_temp is not None:
-                return cpu_avg_temp
-            if cpu_max_temp is not None:
-                return cpu_max_temp
+                # Keep the most preferred valid reading (package, average,
+                # max), or collect cores to average
+                if category == SENSOR_CORE:
+                    cpu_core_temps.append(float(value))
+                elif category < best_category:
+                    best_temp, best_category = float(value), category
+            
+            if best_temp is not None:
+                return best_temp
             if cpu_core_temps:
                 return sum(cpu_core_temps) / len(cpu_core_temps)
             
@@ -194,37 +311,6 @@ class LibreHardwareMonitorDLL:
         return self._error_msg
 
 
-# Visitor class for updating hardware
-# This needs to be defined after imports but we need to handle the case
-# where pythonnet isn't available
-try:
-    import clr
-    from LibreHardwareMonitor.Hardware import IVisitor
-    
-    class _UpdateVisitor(IVisitor):
-        """Visitor that updates hardware and sensors."""
-        
-        def VisitComputer(self, computer):
-            computer.Traverse(self)
-        
-        def VisitHardware(self, hardware):
-            hardware.Update()
-            for subhardware in hardware.SubHardware:
-                subhardware.Accept(self)
-        
-        def VisitSensor(self, sensor):
-            pass
-        
-        def VisitParameter(self, parameter):
-            pass
-
-except Exception:
-    # pythonnet not available or DLL not loaded yet
-    # Create a dummy class that will be replaced when DLL is loaded
-    class _UpdateVisitor:
-        pass
-
-
 class TemperatureMonitor(QThread):
     """
     Background thread that monitors CPU temperature.
@@ -237,62 +323,153 @@ class TemperatureMonitor(QThread):
     temperature_updated = pyqtSignal(float)
     error_occurred = pyqtSignal(str)
     
+    # Time between hardware reads while the widget is hidden and only the
+    # tray icon shows the temperature (seconds)
+    IDLE_HW_INTERVAL = 10.0
+    
+    # Consecutive WMI errors after which the connection is re-established
+    WMI_MAX_FAILURES = 3
+    
+    # Temperature sensors from the LHM/OHM WMI providers, scanned once; the
+    # key property (InstanceId) is then used to query just their values.
+    # The name filters match what the classifiers accept (LIKE ignores
+    # case), so drive, GPU and board sensors are never marshalled.
+    LHM_SENSOR_SCAN_QUERY = (
+        "SELECT InstanceId, Name, Parent FROM Sensor "
+        "WHERE SensorType='Temperature' AND (Name LIKE '%Package%' "
+        "OR Name LIKE '%Max%' OR Name LIKE '%Average%' OR Name LIKE '%Core%')"
+    )
+    OHM_SENSOR_SCAN_QUERY = (
+        "SELECT InstanceId, Name, Parent FROM Sensor "
+        "WHERE SensorType='Temperature' AND (Name LIKE '%CPU%' "
+        "OR Name LIKE '%Core%')"
+    )
+    
+    # ACPI thermal zone (tenths of a Kelvin), queried on root\wmi
+    THERMAL_QUERY = "SELECT CurrentTemperature FROM MSAcpi_ThermalZoneTemperature"
+    
+    # wbemFlagReturnImmediately | wbemFlagForwardOnly
+    WBEM_FLAGS_FAST = 0x10 | 0x20
+    
+    # Number of simulated noise/spike offsets generated per batch
+    SIM_BATCH_SIZE = 60
+    
+    # Simulated baseline: a 60 s wave 4-8 degrees above 48, in 0.1 s steps
+    SIM_WAVE_STEPS = 600
+    SIM_WAVE = tuple(
+        54.0 + 2.0 * math.sin(i * (2 * math.pi / 600)) for i in range(600)
+    )
+    
+    # An unchanged reading is still re-emitted this often (seconds), so
+    # time-based consumers such as the HOT delay keep getting updates
+    EMIT_KEEPALIVE = 5.0
+    
+    # Retry delays for the WMI providers while simulating (seconds, doubling)
+    REINIT_BACKOFF_MIN = 2.0
+    REINIT_BACKOFF_MAX = 60.0
+    
     def __init__(self, update_interval: float = 1.0):
         super().__init__()
         self._interval = update_interval
+        self._idle = False
+        self._last_hw_read_ts = float('-inf')
+        self._last_emitted: Optional[float] = None
+        self._last_emit_ts = float('-inf')
         self._running = False
-        self._mutex = QMutex()
         self._lhm_dll = None
         self._wmi_lhm = None
         self._wmi_ohm = None
         self._wmi_thermal = None
+        self._lhm_sensor_refs: Optional[Tuple[str, Dict[str, int]]] = None
+        self._core_temps: List[float] = []  # Reused on every WMI read
+        self._ohm_sensor_refs: Optional[Tuple[str, Dict[str, int]]] = None
         self._method = "none"
         self._error_shown = False
         self._last_real_temp = None
+        self._temp_fn: Optional[Callable[[], Optional[float]]] = None
+        self._source = "SIM"
+        self._wmi_failures = 0
+        self._sim_offsets: List[float] = []
+        self._sim_idx = 0
+        self._sim_rng = random.Random()
+        self._sim_t0 = time.monotonic()
+        self._timer: Optional[QTimer] = None
+        self._reinit_backoff = self.REINIT_BACKOFF_MIN
+        self._next_reinit_ts = float('inf')
     
     def set_interval(self, interval: float):
         """Set the update interval in seconds."""
-        self._mutex.lock()
+        # A single attribute store is atomic under the GIL, no lock needed
         self._interval = interval
-        self._mutex.unlock()
+        
+        # Restart the poll timer in its own thread so the new interval
+        # applies now rather than after the current one elapses
+        timer = self._timer
+        if timer is not None:
+            QMetaObject.invokeMethod(
+                timer, "start", Qt.ConnectionType.QueuedConnection,
+                Q_ARG(int, int(interval * 1000))
+            )
+    
+    def set_idle(self, idle: bool):
+        """
+        Slow hardware reads down to IDLE_HW_INTERVAL while the widget is
+        hidden. Polling continues because the tray icon still shows the
+        temperature.
+        """
+        self._idle = idle
     
     def _init_lhm_dll(self) -> bool:
         """
         Initialize the bundled LibreHardwareMonitorLib DLL.
         This is the preferred method as it doesn't require any external software.
         """
+        # CPU sensors need admin rights, so don't load the CLR just to fail
+        if not _HAVE_CLR or not is_admin():
+            return False
+        
         try:
             self._lhm_dll = LibreHardwareMonitorDLL()
+            # initialize() only succeeds if CPU temperature sensors were found
             if self._lhm_dll.initialize():
-                # Try to read temperature to verify it works
-                temp = self._lhm_dll.get_cpu_temperature()
-                if temp is not None:
-                    self._method = "LHM-DLL"
-                    return True
+                self._method = "LHM-DLL"
+                return True
         except Exception as e:
             pass
         
         self._lhm_dll = None
         return False
     
+    @staticmethod
+    def _connect_wmi(namespace: str):
+        """
+        Connect straight to a WMI namespace's SWbemServices, skipping the
+        wmi package's per-object property introspection. The connection
+        is kept and reused for every later query.
+        """
+        import win32com.client
+        locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+        return locator.ConnectServer(".", namespace)
+    
+    def _exec_query(self, connection, wql: str):
+        """Run a forward-only, return-immediately WQL query."""
+        return connection.ExecQuery(wql, "WQL", self.WBEM_FLAGS_FAST)
+    
+    def _has_rows(self, connection, wql: str) -> bool:
+        """Check whether a query returns at least one row."""
+        return next(iter(self._exec_query(connection, wql)), None) is not None
+    
     def _init_libre_hardware_monitor_wmi(self) -> bool:
         """
         Initialize WMI connection to LibreHardwareMonitor.
         LHM must be running for this to work.
         """
         try:
-            import wmi
-            self._wmi_lhm = wmi.WMI(namespace="root/LibreHardwareMonitor")
+            self._wmi_lhm = self._connect_wmi("root\\LibreHardwareMonitor")
             
-            # Test if we can read sensors
-            sensors = self._wmi_lhm.Sensor()
-            for sensor in sensors:
-                if sensor.SensorType == "Temperature":
-                    self._method = "LibreHardwareMonitor"
-                    return True
-            
-            # Namespace exists but no temperature sensors yet
-            if sensors:
+            # Test if we can read sensors (temperature sensors may not exist
+            # yet, but the namespace being populated is enough)
+            if self._has_rows(self._wmi_lhm, "SELECT Name FROM Sensor"):
                 self._method = "LibreHardwareMonitor"
                 return True
                 
@@ -307,16 +484,9 @@ class TemperatureMonitor(QThread):
         OHM must be running for this to work.
         """
         try:
-            import wmi
-            self._wmi_ohm = wmi.WMI(namespace="root/OpenHardwareMonitor")
-            
-            sensors = self._wmi_ohm.Sensor()
-            for sensor in sensors:
-                if sensor.SensorType == "Temperature":
-                    self._method = "OpenHardwareMonitor"
-                    return True
+            self._wmi_ohm = self._connect_wmi("root\\OpenHardwareMonitor")
             
-            if sensors:
+            if self._has_rows(self._wmi_ohm, "SELECT Name FROM Sensor"):
                 self._method = "OpenHardwareMonitor"
                 return True
                 
@@ -328,16 +498,11 @@ class TemperatureMonitor(QThread):
     def _init_wmi_thermal(self) -> bool:
         """Initialize WMI thermal zone (requires admin on most systems)."""
         try:
-            import wmi
-            self._wmi_thermal = wmi.WMI(namespace="root/wmi")
+            self._wmi_thermal = self._connect_wmi("root\\wmi")
             
-            temps = self._wmi_thermal.MSAcpi_ThermalZoneTemperature()
-            if temps and temps[0].CurrentTemperature > 0:
-                temp_kelvin = temps[0].CurrentTemperature / 10.0
-                temp_celsius = temp_kelvin - 273.15
-                if 0 < temp_celsius < 150:
-                    self._method = "WMI-ThermalZone"
-                    return True
+            if self._read_thermal_zone() is not None:
+                self._method = "WMI-ThermalZone"
+                return True
                     
         except Exception:
             self._wmi_thermal = None
@@ -356,57 +521,81 @@ class TemperatureMonitor(QThread):
         
         return None
     
+    def _scan_wmi_sensors(self, connection, query: str,
+                          classify: Callable[[str, str], Optional[int]]
+                          ) -> Optional[Tuple[str, Dict[str, int]]]:
+        """
+        Find the CPU temperature sensors (every category, so reads can fall
+        back when the preferred one misses a tick). Returns the query that
+        reads all their values in one round trip, and each sensor's category
+        by InstanceId; None if there are no CPU sensors.
+        """
+        categories = {}
+        for sensor in self._exec_query(connection, query):
+            category = classify(sensor.Name, sensor.Parent)
+            if category is not None:
+                categories[sensor.InstanceId] = category
+        
+        if not categories:
+            return None
+        
+        # WQL string literals escape backslashes and quotes with a backslash
+        ids = " OR ".join(
+            "InstanceId='{}'".format(sid.replace("\\", "\\\\").replace("'", "\\'"))
+            for sid in categories
+        )
+        return f"SELECT InstanceId, Value FROM Sensor WHERE {ids}", categories
+    
+    def _read_wmi_sensors(self, connection,
+                          refs: Tuple[str, Dict[str, int]]) -> Optional[float]:
+        """Query the cached sensors' values and combine them."""
+        read_query, categories = refs
+        best = None
+        best_category = SENSOR_CORE
+        values = self._core_temps
+        values.clear()
+        for row in self._exec_query(connection, read_query):
+            value = row.Value
+            if value is None or value <= 0 or value > 150:
+                continue
+            category = categories.get(row.InstanceId, SENSOR_CORE)
+            if category == SENSOR_CORE:
+                values.append(float(value))
+            elif category < best_category:
+                best, best_category = float(value), category
+        
+        if best is not None:
+            return best
+        if values:
+            return sum(values) / len(values)
+        return None
+    
     def _get_temp_from_lhm(self) -> Optional[float]:
         """Get CPU temperature from LibreHardwareMonitor WMI."""
         if not self._wmi_lhm:
             return None
         
         try:
-            sensors = self._wmi_lhm.Sensor()
-            
-            cpu_package_temp = None
-            cpu_core_temps = []
-            cpu_max_temp = None
-            cpu_avg_temp = None
-            
-            for sensor in sensors:
-                if sensor.SensorType == "Temperature" and sensor.Value is not None:
-                    name = sensor.Name.lower() if sensor.Name else ""
-                    parent = sensor.Parent.lower() if sensor.Parent else ""
-                    
-                    # Check if it's a CPU sensor
-                    is_cpu = "cpu" in parent or "intel" in parent or "amd" in parent or "processor" in parent
-                    
-                    if is_cpu or "cpu" in name or "core" in name:
-                        value = float(sensor.Value)
-                        
-                        if value <= 0 or value > 150:
-                            continue
-                        
-                        # Prioritize different sensor types
-                        if "package" in name:
-                            cpu_package_temp = value
-                        elif "max" in name:
-                            cpu_max_temp = value
-                        elif "average" in name:
-                            cpu_avg_temp = value
-                        elif "core" in name:
-                            cpu_core_temps.append(value)
-            
-            # Return in order of preference
-            if cpu_package_temp is not None:
-                return cpu_package_temp
-            if cpu_avg_temp is not None:
-                return cpu_avg_temp
-            if cpu_max_temp is not None:
-                return cpu_max_temp
-            if cpu_core_temps:
-                return sum(cpu_core_temps) / len(cpu_core_temps)
-            
+            # Sensors are located once; later ticks only query their values
+            if not self._lhm_sensor_refs:
+                self._lhm_sensor_refs = self._scan_wmi_sensors(
+                    self._wmi_lhm, self.LHM_SENSOR_SCAN_QUERY, classify_wmi_sensor
+                )
+            if self._lhm_sensor_refs is None:
+                return None
+            temp = self._read_wmi_sensors(self._wmi_lhm, self._lhm_sensor_refs)
+        except com_error:
+            self._lhm_sensor_refs = None  # Rescan on the next read
+            if self._wmi_read_failed():
+                self._reconnect_wmi(self._init_libre_hardware_monitor_wmi)
+            return None
         except Exception:
-            pass
+            # Unexpected, but must not escape into Qt (which would abort)
+            self._lhm_sensor_refs = None
+            return None
         
-        return None
+        self._wmi_failures = 0
+        return temp
     
     def _get_temp_from_ohm(self) -> Optional[float]:
         """Get CPU temperature from OpenHardwareMonitor WMI."""
@@ -414,34 +603,39 @@ class TemperatureMonitor(QThread):
             return None
         
         try:
-            sensors = self._wmi_ohm.Sensor()
-            
-            cpu_package_temp = None
-            cpu_core_temps = []
-            
-            for sensor in sensors:
-                if sensor.SensorType == "Temperature" and sensor.Value is not None:
-                    name = sensor.Name.lower() if sensor.Name else ""
-                    value = float(sensor.Value)
-                    
-                    if value <= 0 or value > 150:
-                        continue
-                    
-                    if "cpu" in name or "core" in name:
-                        if "package" in name:
-                            cpu_package_temp = value
-                        else:
-                            cpu_core_temps.append(value)
-            
-            if cpu_package_temp is not None:
-                return cpu_package_temp
-            if cpu_core_temps:
-                return sum(cpu_core_temps) / len(cpu_core_temps)
-            
+            if not self._ohm_sensor_refs:
+                self._ohm_sensor_refs = self._scan_wmi_sensors(
+                    self._wmi_ohm, self.OHM_SENSOR_SCAN_QUERY, classify_ohm_sensor
+                )
+            if self._ohm_sensor_refs is None:
+                return None
+            temp = self._read_wmi_sensors(self._wmi_ohm, self._ohm_sensor_refs)
+        except com_error:
+            self._ohm_sensor_refs = None  # Rescan on the next read
+            if self._wmi_read_failed():
+                self._reconnect_wmi(self._init_open_hardware_monitor_wmi)
+            return None
         except Exception:
-            pass
+            # Unexpected, but must not escape into Qt (which would abort)
+            self._ohm_sensor_refs = None
+            return None
         
-        return None
+        self._wmi_failures = 0
+        return temp
+    
+    def _wmi_read_failed(self) -> bool:
+        """Count a failed WMI read; True when the connection should be rebuilt."""
+        self._wmi_failures += 1
+        if self._wmi_failures < self.WMI_MAX_FAILURES:
+            return False
+        self._wmi_failures = 0
+        return True
+    
+    def _reconnect_wmi(self, init_fn: Callable[[], bool]):
+        """Re-establish a WMI provider; if it is gone, simulate and retry later."""
+        if not init_fn():
+            self._select_source(False, False, False, False)
+            self._next_reinit_ts = time.monotonic() + self._reinit_backoff
     
     def _get_temp_from_thermal(self) -> Optional[float]:
         """Get temperature from WMI thermal zone."""
@@ -449,57 +643,73 @@ class TemperatureMonitor(QThread):
             return None
         
         try:
-            temps = self._wmi_thermal.MSAcpi_ThermalZoneTemperature()
-            if temps and temps[0].CurrentTemperature > 0:
-                temp_kelvin = temps[0].CurrentTemperature / 10.0
+            return self._read_thermal_zone()
+        except Exception:
+            pass
+        
+        return None
+    
+    def _read_thermal_zone(self) -> Optional[float]:
+        """Query the first ACPI thermal zone and convert it to Celsius."""
+        for row in self._exec_query(self._wmi_thermal, self.THERMAL_QUERY):
+            # Only the first thermal zone is used
+            if row.CurrentTemperature and row.CurrentTemperature > 0:
+                temp_kelvin = row.CurrentTemperature / 10.0
                 temp_celsius = temp_kelvin - 273.15
                 if 0 < temp_celsius < 150:
                     return temp_celsius
-        except Exception:
-            pass
+            break
         
         return None
     
+    def _refill_sim_offsets(self):
+        """Pre-generate a batch of noise + spike offsets for the simulation."""
+        uniform, rand = self._sim_rng.uniform, self._sim_rng.random
+        self._sim_offsets = [
+            uniform(-1.5, 1.5) + (uniform(5, 10) if rand() < 0.05 else 0)
+            for _ in range(self.SIM_BATCH_SIZE)
+        ]
+        self._sim_idx = 0
+    
     def _get_simulated_temp(self) -> float:
         """Generate simulated temperature for demo."""
-        base = 48.0
-        slow_wave = 8.0 * (0.5 + 0.5 * (time.time() % 60) / 60)
-        noise = random.uniform(-1.5, 1.5)
-        spike = random.uniform(5, 10) if random.random() < 0.05 else 0
-        return round(base + slow_wave + noise + spike, 1)
+        if self._sim_idx >= len(self._sim_offsets):
+            self._refill_sim_offsets()
+        offset = self._sim_offsets[self._sim_idx]
+        self._sim_idx += 1
+        
+        step = int((time.monotonic() - self._sim_t0) * 10) % self.SIM_WAVE_STEPS
+        return round(self.SIM_WAVE[step] + offset, 1)
     
     def get_temperature(self) -> Tuple[Optional[float], str]:
         """
         Get the current CPU temperature.
         Returns: (temperature, source) where source indicates where the reading came from.
         """
-        # Try bundled LHM DLL first (most reliable)
-        temp = self._get_temp_from_dll()
-        if temp is not None:
-            self._last_real_temp = temp
-            return temp, "DLL"
-        
-        # Try LibreHardwareMonitor WMI
-        temp = self._get_temp_from_lhm()
-        if temp is not None:
-            self._last_real_temp = temp
-            return temp, "LHM"
-        
-        # Try OpenHardwareMonitor
-        temp = self._get_temp_from_ohm()
-        if temp is not None:
-            self._last_real_temp = temp
-            return temp, "OHM"
-        
-        # Try WMI Thermal Zone
-        temp = self._get_temp_from_thermal()
-        if temp is not None:
-            self._last_real_temp = temp
-            return temp, "WMI"
+        # Only the source chosen in _select_source() is queried
+        if self._temp_fn is not None:
+            temp = self._temp_fn()
+            if temp is not None:
+                self._last_real_temp = temp
+                return temp, self._source
         
         # Fall back to simulation
         return self._get_simulated_temp(), "SIM"
     
+    def _select_source(self, dll_ok: bool, lhm_ok: bool, ohm_ok: bool, thermal_ok: bool):
+        """Pick the single reader to use based on which source initialized."""
+        readers = (
+            (dll_ok, self._get_temp_from_dll, "DLL"),
+            (lhm_ok, self._get_temp_from_lhm, "LHM"),
+            (ohm_ok, self._get_temp_from_ohm, "OHM"),
+            (thermal_ok, self._get_temp_from_thermal, "WMI"),
+        )
+        self._temp_fn, self._source = None, "SIM"
+        for ok, reader, source in readers:
+            if ok:
+                self._temp_fn, self._source = reader, source
+                return
+    
     def get_method(self) -> str:
         """Get the current temperature reading method."""
         return self._method
@@ -508,14 +718,35 @@ class TemperatureMonitor(QThread):
         """Main monitoring loop."""
         self._running = True
         
+        # COM must be initialized on this thread before any WMI call
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except ImportError:
+            pythoncom = None
+        
+        try:
+            self._run_monitor()
+        finally:
+            # COM objects must be released before COM is torn down
+            self._lhm_sensor_refs = self._ohm_sensor_refs = None
+            self._wmi_lhm = self._wmi_ohm = self._wmi_thermal = None
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
+    
+    def _run_monitor(self):
+        """Initialize the temperature source and run the poll event loop."""
         # Try to initialize temperature sources in order of preference
         dll_ok = self._init_lhm_dll()
         lhm_ok = self._init_libre_hardware_monitor_wmi() if not dll_ok else False
         ohm_ok = self._init_open_hardware_monitor_wmi() if not (dll_ok or lhm_ok) else False
         thermal_ok = self._init_wmi_thermal() if not (dll_ok or lhm_ok or ohm_ok) else False
+        self._select_source(dll_ok, lhm_ok, ohm_ok, thermal_ok)
         
         if not (dll_ok or lhm_ok or ohm_ok or thermal_ok):
             self._method = "Simulation"
+            # LHM/OHM may be started later, so keep retrying them (backed off)
+            self._next_reinit_ts = time.monotonic() + self._reinit_backoff
             if not self._error_shown:
                 self._error_shown = True
                 self.error_occurred.emit(
@@ -523,23 +754,72 @@ class TemperatureMonitor(QThread):
                     "Hardware monitoring requires administrator privileges."
                 )
         
-        while self._running:
-            self._mutex.lock()
-            interval = self._interval
-            self._mutex.unlock()
-            
+        if not self._running:
+            return  # stop() was called during initialization
+        
+        # Poll from a timer on this thread's event loop instead of sleeping.
+        # The QThread object itself lives in the GUI thread, so the tick
+        # must be invoked directly rather than queued to it.
+        self._timer = QTimer()
+        self._timer.setInterval(int(self._interval * 1000))
+        self._timer.timeout.connect(self._tick, Qt.ConnectionType.DirectConnection)
+        self._timer.start()
+        self._tick()
+        
+        self.exec()
+        
+        self._timer.stop()
+        self._timer = None
+    
+    def _tick(self):
+        """Single monitoring step, driven by the poll timer."""
+        if not self._running:
+            return
+        
+        # Hardware is read every tick, or every IDLE_HW_INTERVAL while the
+        # widget is hidden; ticks without a fresh reading emit nothing, the
+        # UI keeps the last value. The simulation has no I/O and only pauses
+        # while idle.
+        now = time.monotonic()
+        if now >= self._next_reinit_ts:
+            self._retry_wmi_sources(now)
+        idle = self._idle
+        tick = self._interval
+        hw_interval = max(tick, self.IDLE_HW_INTERVAL) if idle else tick
+        simulated = self._temp_fn is None and not idle
+        # Half a tick of slack, so timer jitter (a slightly early tick)
+        # doesn't push the read to the tick after
+        if simulated or now - self._last_hw_read_ts >= hw_interval - tick / 2:
+            self._last_hw_read_ts = now
             temp, source = self.get_temperature()
             
-            if temp is not None:
-                self.temperature_updated.emit(temp)
-            else:
-                self.temperature_updated.emit(-1)
-            
-            self.msleep(int(interval * 1000))
+            # Skip re-emitting an unchanged reading (at 0.1 °C), which would
+            # only trigger another identical repaint; the demo always emits
+            shown = round(temp, 1) if temp is not None else -1
+            if (source != "SIM" and shown == self._last_emitted
+                    and now - self._last_emit_ts < self.EMIT_KEEPALIVE):
+                return
+            self._last_emitted = shown
+            self._last_emit_ts = now
+            self.temperature_updated.emit(temp if temp is not None else -1)
+    
+    def _retry_wmi_sources(self, now: float):
+        """Try the LHM/OHM WMI providers again, doubling the delay on failure."""
+        lhm_ok = self._init_libre_hardware_monitor_wmi()
+        ohm_ok = self._init_open_hardware_monitor_wmi() if not lhm_ok else False
+        
+        if lhm_ok or ohm_ok:
+            self._select_source(False, lhm_ok, ohm_ok, False)
+            self._reinit_backoff = self.REINIT_BACKOFF_MIN
+            self._next_reinit_ts = float('inf')
+        else:
+            self._reinit_backoff = min(self._reinit_backoff * 2, self.REINIT_BACKOFF_MAX)
+            self._next_reinit_ts = now + self._reinit_backoff
     
     def stop(self):
         """Stop the monitoring thread."""
         self._running = False
+        self.quit()  # Leave the poll event loop
         
         # Clean up LHM DLL
         if self._lhm_dll:
@@ -556,13 +836,16 @@ class WarningStateTracker:
     
     def __init__(self, threshold: int = 70, hot_delay: float = 5.0):
         self._threshold = threshold
-        self._hot_delay = hot_delay
-        self._above_threshold_since: Optional[float] = None
+        self._hot_delay_ns = int(hot_delay * 1e9)
+        self._above = False
+        self._above_since_ns = 0
+        self._hot_latched = False
     
     def update_threshold(self, threshold: int):
         """Update the warning threshold."""
         self._threshold = threshold
-        self._above_threshold_since = None
+        self._above = False
+        self._hot_latched = False
     
     def update(self, temperature: float) -> Tuple[bool, bool]:
         """
@@ -571,15 +854,22 @@ class WarningStateTracker:
         Returns:
             (is_warning, show_hot): Tuple of warning state and hot indicator state.
         """
-        is_warning = temperature >= self._threshold
-        show_hot = False
-        
-        if is_warning:
-            if self._above_threshold_since is None:
-                self._above_threshold_since = time.time()
-            elif time.time() - self._above_threshold_since >= self._hot_delay:
-                show_hot = True
-        else:
-            self._above_threshold_since = None
+        if temperature < self._threshold:
+            # Common cool case: no clock read at all
+            self._above = False
+            self._hot_latched = False
+            return False, False
+        
+        # Once HOT is shown it stays until the temperature drops
+        if self._hot_latched:
+            return True, True
+        
+        # Monotonic clock (integer ns): unaffected by wall-clock adjustments
+        now = time.monotonic_ns()
+        if not self._above:
+            self._above = True
+            self._above_since_ns = now
+            return True, False
         
-        return is_warning, show_hot
+        self._hot_latched = now - self._above_since_ns >= self._hot_delay_ns
+        return True, self._hot_latched
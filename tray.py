@@ -2,10 +2,12 @@
 System tray icon and menu for CPU Temperature Widget.
 """
 
+import functools
 import os
 import sys
 import tempfile
 from pathlib import Path
+from typing import Optional
 
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont, QAction
@@ -14,6 +16,15 @@ from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
 from config import get_config
 
 
+@functools.cache
+def _render_temp_icon(temp_int: Optional[int], is_warning: bool) -> QIcon:
+    """
+    Render (once per distinct value) the tray icon for a whole-degree reading.
+    Readings are 0-150 °C, so at most ~300 icons ever exist; none are evicted.
+    """
+    return SystemTray._create_temp_icon(temp_int, is_warning)
+
+
 class SystemTray(QSystemTrayIcon):
     """
     System tray icon with context menu.
@@ -24,11 +35,20 @@ class SystemTray(QSystemTrayIcon):
     - Dynamic icon updates (optional: show temperature in icon)
     """
     
+    # Icon colors, shared by every render
+    _BG_WARN = QColor(255, 90, 90)
+    _BG_OK = QColor(80, 160, 255)
+    _FG = QColor(255, 255, 255)
+    _ICON_SIZE = 32
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._config = get_config()
         self._current_temp = 0.0
         self._is_warning = False
+        self._last_rendered = None  # (whole degrees or None, is_warning)
+        self._last_tooltip = None
+        self._toggle_pending = False
         
         self._setup_icon()
         self._setup_menu()
@@ -38,10 +58,34 @@ class SystemTray(QSystemTrayIcon):
     
     def _setup_icon(self):
         """Set up the tray icon."""
-        icon = self._create_temp_icon()
+        icon = _render_temp_icon(None, False)
         self.setIcon(icon)
     
-    def _create_temp_icon(self, temperature: float = None, is_warning: bool = False) -> QIcon:
+    @staticmethod
+    @functools.cache
+    def _base_pixmap(is_warning: bool) -> QPixmap:
+        """Background circle template (needs a QGuiApplication, so built lazily)."""
+        size = SystemTray._ICON_SIZE
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(SystemTray._BG_WARN if is_warning else SystemTray._BG_OK)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(2, 2, size - 4, size - 4)
+        painter.end()
+        
+        return pixmap
+    
+    @staticmethod
+    @functools.cache
+    def _icon_font() -> QFont:
+        """Font for the temperature number."""
+        return QFont("Segoe UI", 10, QFont.Weight.Bold)
+    
+    @staticmethod
+    def _create_temp_icon(temperature: float = None, is_warning: bool = False) -> QIcon:
         """
         Create a tray icon, optionally showing temperature.
         
@@ -49,27 +93,18 @@ class SystemTray(QSystemTrayIcon):
             temperature: Optional temperature to display on icon
             is_warning: Whether to use warning colors
         """
-        # Create a 32x32 pixmap
-        size = 32
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.GlobalColor.transparent)
+        # Start from a copy of the 32x32 background circle
+        pixmap = SystemTray._base_pixmap(is_warning).copy()
         
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Background circle
-        bg_color = QColor(255, 90, 90) if is_warning else QColor(80, 160, 255)
-        painter.setBrush(bg_color)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(2, 2, size - 4, size - 4)
-        
         # Draw temperature or thermometer icon
-        painter.setPen(QColor(255, 255, 255))
+        painter.setPen(SystemTray._FG)
         
         if temperature is not None and temperature >= 0:
             # Show temperature number
-            font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-            painter.setFont(font)
+            painter.setFont(SystemTray._icon_font())
             
             temp_text = f"{int(temperature)}"
             rect = pixmap.rect()
@@ -77,12 +112,12 @@ class SystemTray(QSystemTrayIcon):
         else:
             # Draw simple thermometer icon
             # Thermometer body
-            painter.setBrush(QColor(255, 255, 255))
+            painter.setBrush(SystemTray._FG)
             painter.drawRoundedRect(13, 4, 6, 18, 3, 3)
             # Thermometer bulb
             painter.drawEllipse(11, 20, 10, 10)
             # Mercury
-            painter.setBrush(QColor(255, 90, 90))
+            painter.setBrush(SystemTray._BG_WARN)
             painter.drawRoundedRect(14, 10, 4, 12, 2, 2)
             painter.drawEllipse(12, 21, 8, 8)
         
@@ -181,8 +216,17 @@ class SystemTray(QSystemTrayIcon):
         is_checked = not self._show_action.isChecked()
         self._show_action.setChecked(is_checked)
         self._config.widget_visible = is_checked
-        # Emit signal to parent to handle actual visibility
-        self._show_action.triggered.emit(is_checked)
+        
+        # Notify the parent once the event loop drains, so rapid clicks
+        # collapse into a single show/hide with the final state
+        if not self._toggle_pending:
+            self._toggle_pending = True
+            QTimer.singleShot(0, self._emit_toggle)
+    
+    def _emit_toggle(self):
+        """Emit the (coalesced) show/hide state to the parent."""
+        self._toggle_pending = False
+        self._show_action.triggered.emit(self._show_action.isChecked())
     
     def _toggle_startup(self, checked: bool):
         """Toggle start with Windows setting."""
@@ -190,8 +234,8 @@ class SystemTray(QSystemTrayIcon):
     
     def _quit_application(self):
         """Quit the application cleanly."""
-        # Save config before quitting
-        self._config.save()
+        # Write pending config changes before quitting
+        self._config.flush()
         QApplication.quit()
     
     # Public methods
@@ -206,9 +250,11 @@ class SystemTray(QSystemTrayIcon):
         self._current_temp = temperature
         self._is_warning = is_warning
         
-        # Update icon
-        icon = self._create_temp_icon(temperature if temperature >= 0 else None, is_warning)
-        self.setIcon(icon)
+        # Update icon, only when the displayed number or color changes
+        rendered = (int(temperature) if temperature >= 0 else None, is_warning)
+        if rendered != self._last_rendered:
+            self._last_rendered = rendered
+            self.setIcon(_render_temp_icon(*rendered))
         
         # Update tooltip
         if temperature >= 0:
@@ -218,7 +264,9 @@ class SystemTray(QSystemTrayIcon):
         else:
             tooltip = "CPU Temperature: Unable to read"
         
-        self.setToolTip(tooltip)
+        if tooltip != self._last_tooltip:
+            self._last_tooltip = tooltip
+            self.setToolTip(tooltip)
     
     def sync_visibility_state(self, is_visible: bool):
         """Sync the show/hide action state with actual widget visibility."""
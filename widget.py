@@ -3,22 +3,58 @@ Floating widget window for CPU Temperature Widget.
 A translucent, frameless, always-on-top overlay that displays CPU temperature.
 """
 
+import functools
+
 from PyQt6.QtCore import (
-    Qt, QPoint, QPropertyAnimation, QEasingCurve, 
-    QTimer, pyqtProperty, QSize, QRect
+    Qt, QPropertyAnimation, QEasingCurve, 
+    QTimer, pyqtProperty, QSize, QRect, QRectF
 )
 from PyQt6.QtGui import (
-    QColor, QPainter, QPainterPath, QBrush, QPen, 
-    QFont, QFontDatabase, QScreen, QCursor
+    QColor, QPainter, QPainterPath, QBrush, QPen, QRegion,
+    QFont, QFontDatabase, QScreen, QCursor, QPalette
 )
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout, 
-    QMenu, QApplication, QGraphicsDropShadowEffect
+    QMenu, QApplication, QGraphicsDropShadowEffect, QGraphicsOpacityEffect
 )
 
 from config import get_config
 
 
+@functools.cache
+def _base_font() -> QFont:
+    """
+    Canonical label font, resolved once per process; sizes are cloned from it.
+    (Built lazily: fonts need a QGuiApplication.)
+    """
+    font = QFont("Segoe UI")
+    font.setWeight(QFont.Weight.Medium)
+    return font
+
+
+# Dark style for the right-click menu
+_CONTEXT_MENU_QSS = """
+    QMenu {
+        background-color: #1e1e2e;
+        color: #cdd6f4;
+        border: 1px solid #45475a;
+        border-radius: 6px;
+        padding: 4px;
+    }
+    QMenu::item {
+        padding: 8px 24px;
+        border-radius: 4px;
+    }
+    QMenu::item:selected {
+        background-color: #45475a;
+    }
+    QMenu::separator {
+        height: 1px;
+        background-color: #45475a;
+        margin: 4px 8px;
+    }
+"""
+
 class TemperatureWidget(QWidget):
     """
     Floating translucent widget that displays CPU temperature.
@@ -35,8 +71,14 @@ class TemperatureWidget(QWidget):
     # Colors
     COLOR_NORMAL = QColor(220, 220, 230)       # Light gray-white
     COLOR_WARNING = QColor(255, 90, 90)        # Red
-    COLOR_BACKGROUND = QColor(20, 20, 30, 160) # Semi-transparent dark
-    COLOR_HOT_GLOW = QColor(255, 60, 60, 180)  # Red glow
+    
+    # Background RGB as plain ints; alpha is applied from the transparency
+    _BG_RGB = (20, 20, 30)         # Dark
+    _BORDER_RGB = (80, 80, 100)    # Subtle gray-blue
+    _GLOW_RGB = (255, 60, 60)      # Red glow
+    
+    # Label fonts by point size, shared by all instances
+    _FONT_CACHE: dict[int, QFont] = {}
     
     def __init__(self):
         super().__init__()
@@ -45,15 +87,45 @@ class TemperatureWidget(QWidget):
         self._is_warning = False
         self._show_hot = False
         self._is_error = False
-        self._drag_position = QPoint()
+        self._last_displayed_temp = -999  # Whole degrees, None for error
+        self._drag_offset = None  # (x, y) of the grab point inside the widget
+        self._drag_screens = None  # Screen geometries captured for a drag
+        self._pending_move = None  # (x, y) not yet applied with move()
+        self._pending_pos = None  # Position waiting to be saved to config
+        self._position_restored = False  # Restored on first show only
+        self._context_menu = None  # Built on first right-click
+        self._settings_callback = None
         self._current_color = self.COLOR_NORMAL
         
+        # Background rect (rebuilt on resize) and opacity-dependent brush/pens
+        self._cached_rect = None
+        self._cached_opacity = -1
+        self._bg_brush = None
+        self._border_pen = None
+        self._glow_pen = None
+        
         self._setup_window()
         self._setup_ui()
         self._setup_animations()
-        self._setup_context_menu()
         self._apply_config()
         self._restore_position()
+        
+        # Fold bursts of drag samples into one window move per loop turn
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(0)
+        self._move_timer.timeout.connect(self._flush_move)
+        
+        # Save the position once repositioning settles, not after every drag
+        self._pos_save_timer = QTimer(self)
+        self._pos_save_timer.setSingleShot(True)
+        self._pos_save_timer.setInterval(1000)
+        self._pos_save_timer.timeout.connect(self.flush_position)
+        
+        # A monitor (dis)connected mid-drag invalidates the captured screens
+        app = QApplication.instance()
+        app.screenAdded.connect(self._invalidate_drag_screens)
+        app.screenRemoved.connect(self._invalidate_drag_screens)
     
     def _setup_window(self):
         """Configure window flags and attributes."""
@@ -82,6 +154,9 @@ class TemperatureWidget(QWidget):
         # Temperature label
         self._temp_label = QLabel("CPU: --°C")
         self._temp_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Text color comes from the palette (no style sheet), background
+        # stays transparent
+        self._temp_label.setAutoFillBackground(False)
         
         # HOT indicator (hidden by default)
         self._hot_label = QLabel("HOT")
@@ -121,14 +196,17 @@ class TemperatureWidget(QWidget):
         self._color_animation.setDuration(300)
         self._color_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
         
-        # HOT indicator pulse animation
+        # HOT indicator pulse: fades the label's opacity instead of toggling
+        # its visibility, so only the label repaints and the layout is kept
+        self._hot_effect = QGraphicsOpacityEffect(self._hot_label)
+        self._hot_label.setGraphicsEffect(self._hot_effect)
         self._hot_timer = QTimer(self)
         self._hot_timer.setInterval(500)
         self._hot_timer.timeout.connect(self._pulse_hot_indicator)
         self._hot_visible = True
     
     def _setup_context_menu(self):
-        """Set up the right-click context menu."""
+        """Build the right-click context menu (deferred until first used)."""
         self._context_menu = QMenu(self)
         
         # Lock position action
@@ -141,6 +219,8 @@ class TemperatureWidget(QWidget):
         
         # Settings action
         self._settings_action = self._context_menu.addAction("Settings...")
+        if self._settings_callback is not None:
+            self._settings_action.triggered.connect(self._settings_callback)
         
         self._context_menu.addSeparator()
         
@@ -149,87 +229,95 @@ class TemperatureWidget(QWidget):
         self._exit_action.triggered.connect(QApplication.quit)
         
         # Apply dark style to menu
-        self._context_menu.setStyleSheet("""
-            QMenu {
-                background-color: #1e1e2e;
-                color: #cdd6f4;
-                border: 1px solid #45475a;
-                border-radius: 6px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 8px 24px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: #45475a;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #45475a;
-                margin: 4px 8px;
-            }
-        """)
+        self._context_menu.setStyleSheet(_CONTEXT_MENU_QSS)
     
     def _apply_config(self):
         """Apply current configuration settings."""
-        # Always on top
-        self._update_always_on_top()
-        
-        # Click-through mode
-        self._update_click_through()
-        
-        # Font size
-        self._update_font()
+        # Hold back repaints so the changes below land in one paint event
+        self.setUpdatesEnabled(False)
+        try:
+            # Always on top and click-through mode
+            self._update_window_flags()
+            
+            # Font size
+            self._update_font()
+            
+            # Background opacity
+            self._update_paint_colors()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def _update_font(self):
         """Update the font based on configuration."""
-        font = QFont("Segoe UI", self._config.font_size)
-        font.setWeight(QFont.Weight.Medium)
+        size = self._config.font_size
+        font = self._FONT_CACHE.get(size)
+        if font is None:
+            font = QFont(_base_font())
+            font.setPointSize(size)
+            self._FONT_CACHE[size] = font
+        
+        # Unchanged font: skip the relayout and resize
+        if self._temp_label.font() == font:
+            return
+        
         self._temp_label.setFont(font)
         self._update_label_style()
         
         # Adjust size hint
         self.adjustSize()
     
+    def _update_paint_colors(self):
+        """Rebuild the background brush and pens when the transparency changes."""
+        transparency = self._config.transparency
+        if transparency == self._cached_opacity:
+            return
+        
+        # Alphas scaled by the transparency percentage (integer math)
+        self._bg_brush = QBrush(QColor(*self._BG_RGB, 255 * transparency // 100))
+        
+        # Subtle border
+        self._border_pen = QPen(QColor(*self._BORDER_RGB, transparency), 1)
+        
+        # Hot glow
+        self._glow_pen = QPen(QColor(*self._GLOW_RGB, 60 * transparency // 100), 2)
+        
+        self._cached_opacity = transparency
+        self.update()
+    
     def _update_label_style(self):
-        """Update label style with current color."""
-        color = self._current_color
-        self._temp_label.setStyleSheet(f"""
-            QLabel {{
-                color: rgb({color.red()}, {color.green()}, {color.blue()});
-                background: transparent;
-            }}
-        """)
+        """Update label text color (a palette change, no style sheet parsing)."""
+        palette = self._temp_label.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, self._current_color)
+        self._temp_label.setPalette(palette)
     
-    def _update_always_on_top(self):
-        """Update the always-on-top state."""
-        flags = self.windowFlags()
+    def _update_window_flags(self):
+        """
+        Update the always-on-top and click-through (lock) flags.
+        Changing window flags recreates the native window, so this is done
+        at most once, and only if a flag actually changed.
+        """
+        old_flags = self.windowFlags()
+        flags = old_flags
         
         if self._config.always_on_top:
             flags |= Qt.WindowType.WindowStaysOnTopHint
         else:
             flags &= ~Qt.WindowType.WindowStaysOnTopHint
         
-        self.setWindowFlags(flags)
-        
-        # Re-show the widget (required after changing flags)
-        if self.isVisible():
-            self.show()
-    
-    def _update_click_through(self):
-        """Update click-through mode based on lock state."""
-        flags = self.windowFlags()
-        
         if self._config.position_locked:
             flags |= Qt.WindowType.WindowTransparentForInput
         else:
             flags &= ~Qt.WindowType.WindowTransparentForInput
         
+        if flags == old_flags:
+            return
+        
+        was_visible = self.isVisible()
         self.setWindowFlags(flags)
         
-        # Re-show the widget
-        if self.isVisible():
+        # Re-show the widget (required after changing flags)
+        if was_visible:
             self.show()
     
     def _restore_position(self):
@@ -240,9 +328,13 @@ class TemperatureWidget(QWidget):
             # Validate position is within screen bounds
             screen = QApplication.primaryScreen()
             if screen:
-                screen_geo = screen.availableGeometry()
-                x = max(screen_geo.left(), min(x, screen_geo.right() - self.width()))
-                y = max(screen_geo.top(), min(y, screen_geo.bottom() - self.height()))
+                left, top, right, bottom = screen.availableGeometry().getCoords()
+                max_x = right - self.width()
+                max_y = bottom - self.height()
+                x = max_x if x > max_x else x
+                x = left if x < left else x
+                y = max_y if y > max_y else y
+                y = top if y < top else y
             
             self.move(x, y)
         else:
@@ -258,15 +350,43 @@ class TemperatureWidget(QWidget):
             y = screen_geo.top() + 50  # Near top of screen
             self.move(x, y)
     
+    def _flush_move(self):
+        """Apply the latest pending drag position."""
+        if self._pending_move is not None:
+            self.move(*self._pending_move)
+            self._pending_move = None
+    
+    def _capture_drag_screens(self):
+        """
+        Snapshot each screen as (geometry, (left, top, max_x, max_y)).
+        The full geometry finds the screen under the cursor; the plain-int
+        bounds are the available area less the widget size, which cannot
+        change during a drag.
+        """
+        w = self.width()
+        h = self.height()
+        screens = []
+        for s in QApplication.screens():
+            avail = s.availableGeometry()
+            screens.append((
+                s.geometry(),
+                (avail.left(), avail.top(), avail.right() - w, avail.bottom() - h),
+            ))
+        self._drag_screens = screens
+    
+    def _invalidate_drag_screens(self, screen=None):
+        """Re-query the screen list on the next mouse move."""
+        self._drag_screens = None
+    
     def _toggle_lock(self, checked: bool):
         """Toggle position lock state."""
         self._config.position_locked = checked
-        self._update_click_through()
+        self._update_window_flags()
     
     def _pulse_hot_indicator(self):
-        """Pulse the HOT indicator visibility."""
+        """Pulse the HOT indicator between full and dimmed opacity."""
         self._hot_visible = not self._hot_visible
-        self._hot_label.setVisible(self._hot_visible and self._show_hot)
+        self._hot_effect.setOpacity(1.0 if self._hot_visible else 0.3)
     
     # Qt property for color animation
     def _get_text_color(self) -> QColor:
@@ -282,14 +402,21 @@ class TemperatureWidget(QWidget):
     def update_temperature(self, temperature: float):
         """Update the displayed temperature."""
         self._is_error = temperature < 0
+        if not self._is_error:
+            self._temperature = temperature
+        
+        # Skip the relayout and repaint if the shown text would not change
+        displayed = None if self._is_error else round(temperature)
+        if displayed == self._last_displayed_temp:
+            return
+        self._last_displayed_temp = displayed
         
         if self._is_error:
             self._temp_label.setText("CPU: --°C")
-            self._warning_icon.show()
         else:
-            self._temperature = temperature
             self._temp_label.setText(f"CPU: {temperature:.0f}°C")
-            self._warning_icon.hide()
+        if self._warning_icon.isVisibleTo(self) != self._is_error:
+            self._warning_icon.setVisible(self._is_error)
     
     def set_warning_state(self, is_warning: bool, show_hot: bool):
         """
@@ -299,16 +426,21 @@ class TemperatureWidget(QWidget):
             is_warning: Whether temperature is above threshold
             show_hot: Whether to show the HOT indicator
         """
-        # Update HOT indicator
+        # Update HOT indicator (the glow border is part of the background).
+        # update(), never repaint(): Qt merges pending requests into one paint
+        if show_hot != self._show_hot:
+            self.update()
         self._show_hot = show_hot
         
         if show_hot:
             self._hot_label.show()
-            if not self._hot_timer.isActive():
+            if not self._hot_timer.isActive() and self.isVisible():
                 self._hot_timer.start()
         else:
             self._hot_label.hide()
             self._hot_timer.stop()
+            self._hot_visible = True
+            self._hot_effect.setOpacity(1.0)
         
         # Animate color change
         if is_warning != self._is_warning:
@@ -324,105 +456,157 @@ class TemperatureWidget(QWidget):
     def apply_settings(self):
         """Apply updated settings from configuration."""
         self._apply_config()
-        self._lock_action.setChecked(self._config.position_locked)
+        if self._context_menu is not None:
+            self._lock_action.setChecked(self._config.position_locked)
     
     def reset_position(self):
         """Reset widget position to center of screen."""
+        # Drop a pending drag save so it cannot overwrite the reset
+        self._pos_save_timer.stop()
+        self._pending_pos = None
         self._config.reset_position()
-        self._center_on_screen()
+        self.force_restore_position()
+    
+    def force_restore_position(self):
+        """Re-apply the configured position (centering if none is saved)."""
+        self._restore_position()
+        self._position_restored = True
+    
+    def flush_position(self):
+        """Save a pending (debounced) position to config now."""
+        self._pos_save_timer.stop()
+        if self._pending_pos is not None:
+            self._config.position = self._pending_pos
+            self._pending_pos = None
     
     def connect_settings_action(self, callback):
         """Connect the settings action to a callback."""
-        self._settings_action.triggered.connect(callback)
+        self._settings_callback = callback
+        if self._context_menu is not None:
+            self._settings_action.triggered.connect(callback)
     
     # Event handlers
+    def resizeEvent(self, event):
+        """Invalidate the cached background rect and re-mask on resize."""
+        self._cached_rect = None
+        
+        # Clip the window to the rounded shape so the compositor skips the
+        # transparent corners (one pixel wider than the drawn rect, so the
+        # antialiased edge is kept)
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(self.rect()), 11, 11)
+        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+        
+        super().resizeEvent(event)
+    
     def paintEvent(self, event):
         """Custom paint event for translucent background."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if not event.region().intersects(self.rect()):
+            return
         
-        # Calculate background opacity from config
-        opacity = self._config.transparency / 100.0
-        bg_color = QColor(
-            self.COLOR_BACKGROUND.red(),
-            self.COLOR_BACKGROUND.green(),
-            self.COLOR_BACKGROUND.blue(),
-            int(255 * opacity)
-        )
+        rect = self._cached_rect
+        if rect is None:
+            rect = self._cached_rect = self.rect().adjusted(1, 1, -1, -1)
         
-        # Draw rounded rectangle background
-        path = QPainterPath()
-        rect = self.rect().adjusted(1, 1, -1, -1)
-        path.addRoundedRect(rect.x(), rect.y(), rect.width(), rect.height(), 10, 10)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Fill background
-        painter.fillPath(path, QBrush(bg_color))
+        # Fill rounded rectangle background (drawn directly, no QPainterPath)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._bg_brush)
+        painter.drawRoundedRect(rect, 10, 10)
         
         # Draw subtle border
-        border_color = QColor(80, 80, 100, int(100 * opacity))
-        painter.setPen(QPen(border_color, 1))
-        painter.drawPath(path)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.setPen(self._border_pen)
+        painter.drawRoundedRect(rect, 10, 10)
         
         # Draw hot glow if in warning state
         if self._show_hot:
-            glow_color = QColor(
-                self.COLOR_HOT_GLOW.red(),
-                self.COLOR_HOT_GLOW.green(),
-                self.COLOR_HOT_GLOW.blue(),
-                int(60 * opacity)
-            )
-            painter.setPen(QPen(glow_color, 2))
-            painter.drawPath(path)
+            painter.setPen(self._glow_pen)
+            painter.drawRoundedRect(rect, 10, 10)
     
     def mousePressEvent(self, event):
         """Handle mouse press for dragging."""
         if event.button() == Qt.MouseButton.LeftButton:
             if not self._config.position_locked:
-                self._drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+                # Local grab point; the window is frameless, so no frame
+                # geometry is needed to turn it back into a window position
+                local = event.position()
+                self._drag_offset = (local.x(), local.y())
+                self._invalidate_drag_screens()
                 event.accept()
         elif event.button() == Qt.MouseButton.RightButton:
+            if self._context_menu is None:
+                self._setup_context_menu()
             self._context_menu.exec(event.globalPosition().toPoint())
             event.accept()
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging."""
         if event.buttons() == Qt.MouseButton.LeftButton:
-            if not self._config.position_locked and not self._drag_position.isNull():
-                new_pos = event.globalPosition().toPoint() - self._drag_position
+            if not self._config.position_locked and self._drag_offset is not None:
+                gp = event.globalPosition()
+                x = int(gp.x() - self._drag_offset[0])
+                y = int(gp.y() - self._drag_offset[1])
                 
-                # Constrain to screen bounds
-                screen = QApplication.screenAt(new_pos)
-                if screen is None:
-                    screen = QApplication.primaryScreen()
+                # Constrain to screen bounds (bounds captured once per drag)
+                if self._drag_screens is None:
+                    self._capture_drag_screens()
+                bounds = next(
+                    (b for geo, b in self._drag_screens if geo.contains(x, y)),
+                    self._drag_screens[0][1] if self._drag_screens else None
+                )
                 
-                if screen:
-                    screen_geo = screen.availableGeometry()
-                    new_pos.setX(max(screen_geo.left(), min(new_pos.x(), screen_geo.right() - self.width())))
-                    new_pos.setY(max(screen_geo.top(), min(new_pos.y(), screen_geo.bottom() - self.height())))
+                if bounds is not None:
+                    left, top, max_x, max_y = bounds
+                    x = max_x if x > max_x else x
+                    x = left if x < left else x
+                    y = max_y if y > max_y else y
+                    y = top if y < top else y
                 
-                self.move(new_pos)
+                self._pending_move = (x, y)
+                if not self._move_timer.isActive():
+                    self._move_timer.start()
                 event.accept()
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release after dragging."""
         if event.button() == Qt.MouseButton.LeftButton:
-            self._drag_position = QPoint()
-            # Save position
+            self._drag_offset = None
+            self._drag_screens = None
+            # Land on the final position before it is saved
+            self._move_timer.stop()
+            self._flush_move()
+            # Save position (debounced)
             if not self._config.position_locked:
                 pos = self.pos()
-                self._config.position = (pos.x(), pos.y())
+                self._pending_pos = (pos.x(), pos.y())
+                self._pos_save_timer.start()
             event.accept()
     
     def showEvent(self, event):
         """Handle show event."""
         super().showEvent(event)
-        # Restore position when shown
-        self._restore_position()
+        # Restore position on first show; later shows (e.g. after window
+        # flag changes) keep the current position
+        if not self._position_restored:
+            self.force_restore_position()
+        
+        # Resume the HOT pulse if it was stopped while hidden
+        if self._show_hot and not self._hot_timer.isActive():
+            self._hot_timer.start()
+    
+    def hideEvent(self, event):
+        """Stop the HOT pulse while hidden; nothing would be drawn anyway."""
+        self._hot_timer.stop()
+        super().hideEvent(event)
     
     def closeEvent(self, event):
         """Handle close event."""
-        # Save position before closing
+        # Save position before closing, skipping the debounce
         if not self._config.position_locked:
             pos = self.pos()
-            self._config.position = (pos.x(), pos.y())
+            self._pending_pos = (pos.x(), pos.y())
+        self.flush_position()
         super().closeEvent(event)